@@ -100,7 +100,7 @@ class AudioRoutingController:
         self,
         mode: str,
         matrix_enabled: bool | None = None,
-        matrix: list[list[int]] | None = None,
+        matrix: np.ndarray | None = None,
     ) -> int:
         _ = (mode, matrix_enabled, matrix)
         return 0
@@ -109,23 +109,39 @@ class AudioRoutingController:
         _ = mode
         return self._txt("Automatisch (bron-layout)", "Automatic (source layout)")
 
-    def _audio_output_devices(self) -> list[QAudioDevice]:
+    def _cached_audio_outputs(self) -> tuple[list[QAudioDevice], QAudioDevice] | None:
+        # Enumeration goes through the platform audio service (COM on WASAPI), so the device list and
+        # default output are kept until audioOutputsChanged drops them.
+        cached = self._audio_outputs_cache
+        if cached is not None:
+            return cached
         try:
-            return list(QMediaDevices.audioOutputs())
+            outputs = list(QMediaDevices.audioOutputs())
+            default_device = QMediaDevices.defaultAudioOutput()
         except Exception:  # noqa: BLE001
-            return []
+            return None
+        self._audio_outputs_cache = (outputs, default_device)
+        return self._audio_outputs_cache
+
+    def _audio_output_devices(self) -> list[QAudioDevice]:
+        cached = self._cached_audio_outputs()
+        return list(cached[0]) if cached is not None else []
+
+    def _default_audio_output(self) -> QAudioDevice:
+        cached = self._cached_audio_outputs()
+        return cached[1] if cached is not None else QMediaDevices.defaultAudioOutput()
 
     def _resolve_audio_device(
         self,
         preferred_key: str,
         routing_mode: str,
         matrix_enabled: bool | None = None,
-        matrix: list[list[int]] | None = None,
+        matrix: np.ndarray | None = None,
         devices: list[QAudioDevice] | None = None,
     ) -> tuple[QAudioDevice, QAudioDevice, bool, int]:
         _ = (routing_mode, matrix_enabled, matrix)
         outputs = devices if devices is not None else self._audio_output_devices()
-        default_device = QMediaDevices.defaultAudioOutput()
+        default_device = self._default_audio_output()
 
         preferred = default_device
         if preferred_key:
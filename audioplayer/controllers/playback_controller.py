@@ -25,6 +25,7 @@ class PlaybackController:
         setattr(host, name, value)
 
     def _on_audio_outputs_changed(self) -> None:
+        self._audio_outputs_cache = None
         self._apply_audio_preferences(update_status=False)
 
     def _start_playback_smooth(self, from_track_start: bool = False) -> None:
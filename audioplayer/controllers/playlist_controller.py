@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import soundfile as sf
-from PySide6.QtCore import Qt, QUrl
+from PySide6.QtCore import QSignalBlocker, Qt, QUrl
 from PySide6.QtGui import QDragEnterEvent, QDragMoveEvent, QDropEvent
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import QFileDialog, QListWidgetItem, QMessageBox
+from shiboken6 import delete as delete_qt_object
 
 from audioplayer.constants import AUDIO_EXTENSIONS
 from audioplayer.models import Track
 
+# Each row carries its Track object, so reordering maps rows back to tracks without path lookups.
+_TRACK_ROLE = Qt.ItemDataRole.UserRole + 1
+
 
 class PlaylistController:
     def __init__(self, host) -> None:
@@ -47,15 +51,16 @@ class PlaylistController:
         self._remove_from_preload_queue(removed_track.path)
         self.wave_partial.pop(removed_track.path, None)
         if removed_track.path == self._active_wave_path:
-            self._stop_active_wave_worker(wait_ms=80)
-        if removed_track.path == self._preload_path:
-            self._stop_preload_worker(requeue=False, wait_ms=80)
+            self._stop_active_wave_worker()
+        if removed_track.path in self._preload_jobs:
+            self._stop_preload_worker(requeue=False, path=removed_track.path)
 
         self.tracks.pop(row)
-        self.playlist.blockSignals(True)
-        item = self.playlist.takeItem(row)
-        del item
-        self.playlist.blockSignals(False)
+        with QSignalBlocker(self.playlist):
+            item = self.playlist.takeItem(row)
+            if item is not None:
+                # takeItem hands ownership back to us; free the C++ item (and its role data) right away.
+                delete_qt_object(item)
 
         if not self.tracks:
             self.current_index = None
@@ -76,79 +81,151 @@ class PlaylistController:
             self.current_index -= 1
             self.playlist.setCurrentRow(self.current_index)
 
+    def _duration_signature(self, path: str) -> tuple:
+        try:
+            return self._file_signature(path)
+        except OSError:
+            return ()
+
     def _track_duration(self, path: str) -> float:
+        # Entries survive restarts, so they are only trusted while size and mtime still match.
+        signature = self._duration_signature(path)
         cached = self._duration_cache.get(path)
-        if cached is not None:
-            return cached
+        if cached is not None and cached[0] == signature:
+            self._remember_duration(path, signature, cached[1])
+            return cached[1]
+
+        duration = self._read_track_duration(path)
+        self._remember_duration(path, signature, duration)
+        return duration
+
+    def _remember_duration(self, path: str, signature: tuple, duration: float) -> None:
+        # Re-insert so dict order follows last use; _save_duration_cache keeps the tail.
+        self._duration_cache.pop(path, None)
+        self._duration_cache[path] = (signature, duration)
+
+    @staticmethod
+    def _read_track_duration(path: str) -> float:
+        import soundfile as sf
 
         try:
             info = sf.info(path)
-            duration = float(info.frames) / float(info.samplerate) if info.samplerate else 0.0
+            return float(info.frames) / float(info.samplerate) if info.samplerate else 0.0
         except Exception:  # noqa: BLE001
-            duration = 0.0
-        self._duration_cache[path] = duration
-        return duration
+            return 0.0
+
+    def _track_durations(self, paths: list[str]) -> list[float]:
+        signatures = [self._duration_signature(path) for path in paths]
+        missing: dict[str, tuple] = {}
+        for path, signature in zip(paths, signatures):
+            cached = self._duration_cache.get(path)
+            if cached is None or cached[0] != signature:
+                missing[path] = signature
+            else:
+                self._remember_duration(path, signature, cached[1])
+        if missing:
+            # Header reads are independent and bound by file-open latency, so a cold playlist overlaps them.
+            # Only the GUI thread writes the cache, once all reads are back.
+            workers = min(8, len(missing))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    durations = list(pool.map(self._read_track_duration, missing))
+            else:
+                durations = [self._read_track_duration(path) for path in missing]
+            for (path, signature), duration in zip(missing.items(), durations):
+                self._remember_duration(path, signature, duration)
+        return [self._duration_cache[path][1] for path in paths]
 
     def _rebuild_playlist_items(self, selected_path: str) -> None:
-        self.playlist.blockSignals(True)
-        self.playlist.clear()
         selected_row = -1
-        for idx, track in enumerate(self.tracks):
-            item = QListWidgetItem(track.name)
-            item.setToolTip(track.path)
-            item.setData(Qt.ItemDataRole.UserRole, track.path)
-            self.playlist.addItem(item)
-            if selected_row < 0 and track.path == selected_path:
-                selected_row = idx
-        self.playlist.blockSignals(False)
+        with QSignalBlocker(self.playlist):
+            self.playlist.clear()
+            for idx, track in enumerate(self.tracks):
+                item = QListWidgetItem(track.name)
+                item.setToolTip(track.path)
+                item.setData(Qt.ItemDataRole.UserRole, track.path)
+                item.setData(_TRACK_ROLE, track)
+                self.playlist.addItem(item)
+                if selected_row < 0 and track.path == selected_path:
+                    selected_row = idx
 
         if selected_row < 0 and self.tracks:
             selected_row = 0
         if selected_row >= 0:
             self.playlist.setCurrentRow(selected_row)
 
+    def _reorder_playlist_items(self, order: list[int], selected_path: str) -> None:
+        old_tracks = self.tracks
+        self.tracks = [old_tracks[index] for index in order]
+        if self.playlist.count() != len(old_tracks):
+            self._rebuild_playlist_items(selected_path)
+            return
+
+        # A sort is a permutation: only the span between the unchanged head and tail has to move,
+        # and its existing items are moved rather than recreated.
+        start = 0
+        end = len(order)
+        while start < end and order[start] == start:
+            start += 1
+        while end > start and order[end - 1] == end - 1:
+            end -= 1
+        if start < end:
+            self.playlist.setUpdatesEnabled(False)
+            try:
+                with QSignalBlocker(self.playlist):
+                    span = [self.playlist.takeItem(row) for row in range(end - 1, start - 1, -1)]
+                    span.reverse()
+                    for offset, index in enumerate(order[start:end]):
+                        self.playlist.insertItem(start + offset, span[index - start])
+            finally:
+                self.playlist.setUpdatesEnabled(True)
+
+        selected_row = next((row for row, track in enumerate(self.tracks) if track.path == selected_path), -1)
+        if selected_row >= 0:
+            # The loaded track only moved; follow it without reloading (and stopping) playback.
+            with QSignalBlocker(self.playlist):
+                self.playlist.setCurrentRow(selected_row)
+            self.current_index = selected_row
+        elif self.tracks:
+            self.playlist.setCurrentRow(0)
+
     def sort_playlist_by_name(self) -> None:
         if not self.tracks:
             return
         selected_path = self._current_track_path()
-        self.tracks.sort(key=lambda track: track.name.lower())
-        self._rebuild_playlist_items(selected_path)
+        tracks = self.tracks
+        order = sorted(range(len(tracks)), key=lambda index: tracks[index].name.lower())
+        self._reorder_playlist_items(order, selected_path)
 
     def sort_playlist_by_time_asc(self) -> None:
         if not self.tracks:
             return
         selected_path = self._current_track_path()
-        self.tracks.sort(key=lambda track: self._track_duration(track.path))
-        self._rebuild_playlist_items(selected_path)
+        durations = self._track_durations([track.path for track in self.tracks])
+        order = sorted(range(len(durations)), key=durations.__getitem__)
+        self._reorder_playlist_items(order, selected_path)
 
     def sort_playlist_by_time_desc(self) -> None:
         if not self.tracks:
             return
         selected_path = self._current_track_path()
-        self.tracks.sort(key=lambda track: self._track_duration(track.path), reverse=True)
-        self._rebuild_playlist_items(selected_path)
+        durations = self._track_durations([track.path for track in self.tracks])
+        order = sorted(range(len(durations)), key=durations.__getitem__, reverse=True)
+        self._reorder_playlist_items(order, selected_path)
 
     def _sync_tracks_from_playlist(self) -> None:
         if self.playlist.count() != len(self.tracks):
             return
 
-        path_to_tracks: dict[str, list[Track]] = {}
-        for track in self.tracks:
-            path_to_tracks.setdefault(track.path, []).append(track)
-
         reordered_tracks: list[Track] = []
         for i in range(self.playlist.count()):
             item = self.playlist.item(i)
-            path_data = item.data(Qt.ItemDataRole.UserRole)
-            path = str(path_data) if path_data else item.toolTip()
-            bucket = path_to_tracks.get(path, [])
-            if bucket:
-                track = bucket.pop(0)
-            else:
+            track = item.data(_TRACK_ROLE)
+            if not isinstance(track, Track):
+                path_data = item.data(Qt.ItemDataRole.UserRole)
+                path = str(path_data) if path_data else item.toolTip()
                 track = Track(path=path, name=item.text())
-            item.setToolTip(track.path)
-            item.setData(Qt.ItemDataRole.UserRole, track.path)
-            item.setText(track.name)
+                item.setData(_TRACK_ROLE, track)
             reordered_tracks.append(track)
 
         self.tracks = reordered_tracks
@@ -157,7 +234,10 @@ class PlaylistController:
 
     @staticmethod
     def _is_supported_audio_path(path: str) -> bool:
-        return Path(path).suffix.lower() in AUDIO_EXTENSIONS
+        # Plain string slicing; building a Path per file dominated large folder drops.
+        name = os.path.basename(path)
+        dot = name.rfind(".")
+        return dot > 0 and name[dot:].lower() in AUDIO_EXTENSIONS
 
     @staticmethod
     def _extract_local_paths_from_mime(mime_data) -> list[str]:
@@ -165,6 +245,33 @@ class PlaylistController:
             return []
         return [url.toLocalFile() for url in mime_data.urls() if url.isLocalFile()]
 
+    @staticmethod
+    def _scan_audio_files(root: str) -> list[str]:
+        # Same order and symlink rules as os.walk, but filtered on the DirEntry name
+        # and its cached type instead of a join plus a Path per file.
+        found: list[str] = []
+        pending = [root]
+        while pending:
+            directory = pending.pop()
+            subdirs: list[str] = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        if is_dir:
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                            continue
+                        if PlaylistController._is_supported_audio_path(entry.name):
+                            found.append(entry.path)
+            except OSError:
+                continue
+            pending.extend(reversed(subdirs))
+        return found
+
     def _normalize_input_paths(self, paths: list[str]) -> list[str]:
         normalized: list[str] = []
         seen: set[str] = set()
@@ -174,15 +281,11 @@ class PlaylistController:
                 continue
             path = os.path.abspath(os.path.expanduser(raw))
             if os.path.isdir(path):
-                for root, _, files in os.walk(path):
-                    for name in files:
-                        candidate = os.path.join(root, name)
-                        if not self._is_supported_audio_path(candidate):
-                            continue
-                        if candidate in seen:
-                            continue
-                        seen.add(candidate)
-                        normalized.append(candidate)
+                for candidate in self._scan_audio_files(path):
+                    if candidate in seen:
+                        continue
+                    seen.add(candidate)
+                    normalized.append(candidate)
                 continue
 
             if not os.path.isfile(path):
@@ -204,15 +307,21 @@ class PlaylistController:
 
         was_playing = self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         first_new_row: int | None = None
-        for path in new_paths:
-            track = Track(path=path, name=Path(path).name)
-            self.tracks.append(track)
-            item = QListWidgetItem(track.name)
-            item.setToolTip(path)
-            item.setData(Qt.ItemDataRole.UserRole, path)
-            self.playlist.addItem(item)
-            if first_new_row is None:
-                first_new_row = self.playlist.count() - 1
+        # One repaint for the whole drop instead of one per inserted row; the view's item layout is already deferred.
+        self.playlist.setUpdatesEnabled(False)
+        try:
+            for path in new_paths:
+                track = Track(path=path, name=os.path.basename(path))
+                self.tracks.append(track)
+                item = QListWidgetItem(track.name)
+                item.setToolTip(path)
+                item.setData(Qt.ItemDataRole.UserRole, path)
+                item.setData(_TRACK_ROLE, track)
+                self.playlist.addItem(item)
+                if first_new_row is None:
+                    first_new_row = self.playlist.count() - 1
+        finally:
+            self.playlist.setUpdatesEnabled(True)
 
         should_activate_first_new = False
         if first_new_row is not None:
@@ -272,6 +381,8 @@ class PlaylistController:
         self.current_index = row
         path = self.tracks[row].path
 
+        import soundfile as sf
+
         try:
             info = sf.info(path)
             self.sample_rate = int(info.samplerate)
@@ -279,7 +390,7 @@ class PlaylistController:
             channels = int(info.channels)
             fmt = f"{info.format}/{info.subtype}"
             self.duration_s = frames / float(self.sample_rate) if self.sample_rate else 0.0
-            self._duration_cache[path] = self.duration_s
+            self._remember_duration(path, self._duration_signature(path), self.duration_s)
 
             self.player.stop()
             playback_source = self._resolve_playback_source(path)
@@ -309,7 +420,7 @@ class PlaylistController:
             self.status.setText(f"{self.format_time(0)} / {self.format_time(self.duration_s)}")
 
             self._load_waveform_for_track(path)
-            self._enqueue_preload([t.path for i, t in enumerate(self.tracks) if i != row])
+            self._enqueue_preload_except(row)
 
             if self._autoplay_on_load:
                 self._start_playback_smooth(from_track_start=True)
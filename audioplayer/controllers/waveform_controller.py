@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import time
+from contextlib import contextmanager
+from pathlib import Path
 
 import numpy as np
 import pyqtgraph as pg
@@ -9,7 +11,27 @@ from PySide6.QtGui import QColor
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import QMessageBox
 
-from audioplayer.waveform import WaveformJob
+from audioplayer.waveform import (
+    WAVE_AMP_SCALE,
+    WaveformJob,
+    quantize_wave_amplitudes,
+    wave_channel_bands,
+    wave_step_edges,
+)
+
+
+# The redraw path (align, edges, combine, bands) is bandwidth-bound: each step streams O(points x channels)
+# float32 values through one or two flops. Wins come from moving fewer bytes (no defensive casts or copies),
+# not from trimming arithmetic.
+_EMPTY_F32 = np.empty(0, dtype=np.float32)
+_EMPTY_F32.flags.writeable = False
+
+
+def _as_f32(values) -> np.ndarray:
+    # Worker output is already contiguous float32; only foreign inputs pay for a conversion.
+    if isinstance(values, np.ndarray) and values.dtype == np.float32 and values.flags.c_contiguous:
+        return values
+    return np.ascontiguousarray(values, dtype=np.float32)
 
 
 class WaveformController:
@@ -29,16 +51,19 @@ class WaveformController:
             return
         setattr(host, name, value)
     def _align_wave_arrays(self, x: np.ndarray, amplitude: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
-        x_arr = np.asarray(x, dtype=np.float32).reshape(-1)
-        amp_arr = np.asarray(amplitude, dtype=np.float32).reshape(-1)
+        x_arr = _as_f32(x).reshape(-1)
+        amp_arr = _as_f32(amplitude).reshape(-1)
         if x_arr.size == 0 or amp_arr.size == 0:
             return x_arr[:0], amp_arr[:0]
         n = min(x_arr.size, amp_arr.size)
         return x_arr[:n], amp_arr[:n]
 
     def _align_wave_channels(self, x: np.ndarray, amplitudes) -> tuple[np.ndarray, np.ndarray]:
-        x_arr = np.asarray(x, dtype=np.float32).reshape(-1)
-        amp_arr = np.asarray(amplitudes, dtype=np.float32)
+        x_arr = _as_f32(x).reshape(-1)
+        amp_arr = np.asarray(amplitudes)
+        quantized = amp_arr.dtype == np.int16
+        if not quantized:
+            amp_arr = _as_f32(amp_arr)
         if amp_arr.ndim == 0:
             amp_arr = amp_arr.reshape(1, 1)
         elif amp_arr.ndim == 1:
@@ -49,18 +74,26 @@ class WaveformController:
             return x_arr[:0], np.empty((0, 1), dtype=np.float32)
         n = min(x_arr.size, amp_arr.shape[0])
         x_arr = x_arr[:n]
-        amp_arr = np.ascontiguousarray(amp_arr[:n], dtype=np.float32)
-        amp_arr = np.nan_to_num(amp_arr, nan=0.0, posinf=1.0, neginf=0.0, copy=False)
-        amp_arr = np.clip(amp_arr, 0.0, 1.0)
+        if quantized:
+            # Cached envelopes are stored as int16 peaks; scaling is the one float32 conversion and copy.
+            return x_arr, np.multiply(amp_arr[:n], np.float32(1.0 / WAVE_AMP_SCALE), dtype=np.float32)
+        # One clipping pass makes the only copy (inputs may be worker views or read-only cache entries) and already
+        # maps +/-inf to the bounds; NaN survives clip, so only then is a second in-place pass needed.
+        amp_arr = np.clip(amp_arr[:n], 0.0, 1.0)
+        if np.isnan(amp_arr).any():
+            np.nan_to_num(amp_arr, nan=0.0, copy=False)
         return x_arr, amp_arr
 
     @staticmethod
     def _sanitize_wave_array(values: np.ndarray) -> np.ndarray:
-        arr = np.asarray(values, dtype=np.float32).reshape(-1)
+        arr = _as_f32(values).reshape(-1)
         if arr.size == 0:
             return arr
+        # Real audio is almost always finite: a read-only check spares the write pass of nan_to_num.
+        if np.isfinite(arr).all():
+            return arr
         # Keep waveform rendering stable even when source data briefly contains non-finite values.
-        return np.nan_to_num(arr, nan=0.0, posinf=1.0, neginf=-1.0, copy=False)
+        return np.nan_to_num(arr, nan=0.0, posinf=1.0, neginf=-1.0, copy=not arr.flags.writeable)
 
     def _safe_set_step_wave_item(
         self,
@@ -75,8 +108,8 @@ class WaveformController:
         if n <= 0:
             item.setData([], [], connect="all")
             return
-        x_arr = np.ascontiguousarray(x_arr[: n + 1], dtype=np.float32)
-        y_arr = np.ascontiguousarray(y_arr[:n], dtype=np.float32)
+        x_arr = _as_f32(x_arr[: n + 1])
+        y_arr = _as_f32(y_arr[:n])
         # pyqtgraph clipping currently breaks stepMode center by slicing x/y equally.
         # Ensure this item always renders with safe settings.
         if item.opts.get("clipToView"):
@@ -84,69 +117,125 @@ class WaveformController:
         item.setData(x_arr, y_arr, connect="all", fillLevel=float(fill_level))
 
     def _compute_wave_edges(self, x_values: np.ndarray) -> np.ndarray:
-        x_arr = np.asarray(x_values, dtype=np.float32).reshape(-1)
+        x_arr = _as_f32(x_values).reshape(-1)
         if x_arr.size == 0:
             return x_arr
+        # View switches and partial redraws keep handing in the same (shared, read-only) time axis.
+        key = (
+            x_arr.ctypes.data,
+            x_arr.size,
+            float(x_arr[0]),
+            float(x_arr[-1]),
+            self.duration_s,
+            self.min_window_s,
+        )
+        cached = self._edges_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        edges = self._build_wave_edges(x_arr)
+        edges.flags.writeable = False
+        self._edges_cache = (key, edges)
+        return edges
+
+    def _build_wave_edges(self, x_arr: np.ndarray) -> np.ndarray:
         if x_arr.size == 1:
             width = max(self.duration_s, self.min_window_s, 1.0)
             return np.array(
                 [max(0.0, float(x_arr[0]) - (width / 2.0)), float(x_arr[0]) + (width / 2.0)],
                 dtype=np.float32,
             )
+        # Fresh array per build: pyqtgraph keeps a reference to whatever setData is given.
+        return wave_step_edges(x_arr)
 
-        dx = np.diff(x_arr)
-        mids = (x_arr[:-1] + x_arr[1:]) / 2.0
-        first = max(0.0, float(x_arr[0]) - float(dx[0]) / 2.0)
-        last = float(x_arr[-1]) + float(dx[-1]) / 2.0
-        return np.concatenate(([first], mids, [last])).astype(np.float32, copy=False)
-
-    @staticmethod
-    def _combine_channels_to_single(amplitudes: np.ndarray) -> np.ndarray:
-        amp_arr = np.asarray(amplitudes, dtype=np.float32)
+    def _combine_channels_to_single(self, amplitudes: np.ndarray) -> np.ndarray:
+        amp_arr = _as_f32(amplitudes)
         if amp_arr.ndim == 1:
             return amp_arr
         if amp_arr.size == 0:
             return np.asarray([], dtype=np.float32)
-        return np.max(amp_arr, axis=1).astype(np.float32, copy=False)
+        if amp_arr.shape[1] == 1:
+            return amp_arr[:, 0]
+        # Amplitudes are non-negative peaks, so a plain max reduce is the peak. The result goes straight
+        # to setData, which keeps a reference, so it is a new array on every call.
+        return amp_arr.max(axis=1)
 
     def _ensure_channel_wave_items(self, channel_count: int) -> None:
         target_count = max(0, int(channel_count))
         while len(self._channel_wave_items) > target_count:
             top_item, bottom_item = self._channel_wave_items.pop()
+            del self._channel_wave_items_flat[-2:]
             self.plot.removeItem(top_item)
             self.plot.removeItem(bottom_item)
+        if len(self._channel_wave_items) < target_count:
+            top_pen = pg.mkPen(width=1.0, color=self._wave_top_color)
+            bottom_pen = pg.mkPen(width=1.0, color=self._wave_bottom_color)
+            fill_brush = pg.mkBrush(self._wave_fill_color)
         while len(self._channel_wave_items) < target_count:
             top_item = self.plot.plot(
                 [],
                 [],
-                pen=pg.mkPen(width=1.0, color=self._wave_top_color),
+                pen=top_pen,
                 fillLevel=0,
-                brush=pg.mkBrush(self._wave_fill_color),
+                brush=fill_brush,
                 stepMode="center",
             )
             bottom_item = self.plot.plot(
                 [],
                 [],
-                pen=pg.mkPen(width=1.0, color=self._wave_bottom_color),
+                pen=bottom_pen,
                 fillLevel=0,
-                brush=pg.mkBrush(self._wave_fill_color),
+                brush=fill_brush,
                 stepMode="center",
             )
             top_item.setClipToView(False)
             bottom_item.setClipToView(False)
             self._channel_wave_items.append((top_item, bottom_item))
+            self._channel_wave_items_flat.extend((top_item, bottom_item))
         self._apply_channel_wave_item_styles()
 
     def _apply_channel_wave_item_styles(self) -> None:
+        # Same item count and colours as the last pass means every pen and brush is already in place.
+        style_key = (
+            len(self._channel_wave_items),
+            self._wave_top_color.rgba(),
+            self._wave_bottom_color.rgba(),
+            self._wave_fill_color.rgba(),
+        )
+        if style_key == self._channel_style_key:
+            return
+        self._channel_style_key = style_key
         total = max(1, len(self._channel_wave_items))
-        for index, (top_item, bottom_item) in enumerate(self._channel_wave_items):
-            fade = 1.0 if total == 1 else (0.95 - (index / (total - 1)) * 0.22)
+        if total == 1:
+            fades = np.ones(1, dtype=np.float64)
+        else:
+            fades = 0.95 - (np.arange(total, dtype=np.float64) / (total - 1)) * 0.22
+        # Later channels fade slightly; the whole alpha table is one clipped pass.
+        alphas = np.clip((self._wave_fill_color.alpha() * fades).astype(np.int32), 36, 225).tolist()
+        top_pen = pg.mkPen(width=1.0, color=self._wave_top_color)
+        bottom_pen = pg.mkPen(width=1.0, color=self._wave_bottom_color)
+        for (top_item, bottom_item), alpha in zip(self._channel_wave_items, alphas):
             fill = QColor(self._wave_fill_color)
-            fill.setAlpha(max(36, min(225, int(fill.alpha() * fade))))
-            top_item.setPen(pg.mkPen(width=1.0, color=self._wave_top_color))
-            bottom_item.setPen(pg.mkPen(width=1.0, color=self._wave_bottom_color))
-            top_item.setBrush(pg.mkBrush(fill))
-            bottom_item.setBrush(pg.mkBrush(fill))
+            fill.setAlpha(alpha)
+            top_item.setPen(top_pen)
+            bottom_item.setPen(bottom_pen)
+            fill_brush = pg.mkBrush(fill)
+            top_item.setBrush(fill_brush)
+            bottom_item.setBrush(fill_brush)
+
+    @contextmanager
+    def _batched_wave_update(self):
+        # Hold repaints and auto-range while several items change, then settle once at the end.
+        view_box = self.plot.getViewBox()
+        auto_x, auto_y = view_box.state["autoRange"]
+        view_box.disableAutoRange()
+        self.plot.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            if auto_x or auto_y:
+                view_box.enableAutoRange(x=auto_x, y=auto_y)
+            self.plot.setUpdatesEnabled(True)
+            self.plot.update()
 
     def _set_waveform_multichannel(self, x: np.ndarray, amplitudes: np.ndarray) -> None:
         x_arr, amp_arr = self._align_wave_channels(x, amplitudes)
@@ -160,25 +249,45 @@ class WaveformController:
             self._clear_waveform_plot()
             return
 
-        self.wave_top.setData([], [], connect="all")
-        self.wave_bottom.setData([], [], connect="all")
-
         channel_count = amp_arr.shape[1]
-        self._ensure_channel_wave_items(channel_count)
         edges = edges[: n + 1]
         amp_arr = amp_arr[:n]
 
         slot_height = 1.8 / max(1, channel_count)
-        band_half = slot_height * 0.42
-        for channel_index, (top_item, bottom_item) in enumerate(self._channel_wave_items):
-            center = 0.9 - (channel_index + 0.5) * slot_height
-            channel_amp = amp_arr[:, channel_index]
-            top_values = center + (channel_amp * band_half)
-            bottom_values = center - (channel_amp * band_half)
-            self._safe_set_step_wave_item(top_item, edges, top_values, fill_level=center)
-            self._safe_set_step_wave_item(bottom_item, edges, bottom_values, fill_level=center)
+        band_half = np.float32(slot_height * 0.42)
+        centers = np.float32(0.9) - (np.arange(channel_count, dtype=np.float32) + np.float32(0.5)) * np.float32(slot_height)
+        # All bands in one (channels, n) pass; each row is then a contiguous per-item view.
+        tops, bottoms = wave_channel_bands(amp_arr, centers, band_half)
+        with self._batched_wave_update():
+            self.wave_top.setData([], [], connect="all")
+            self.wave_bottom.setData([], [], connect="all")
+            self._ensure_channel_wave_items(channel_count)
+            for channel_index, (top_item, bottom_item) in enumerate(self._channel_wave_items):
+                center = float(centers[channel_index])
+                self._safe_set_step_wave_item(top_item, edges, tops[channel_index], fill_level=center)
+                self._safe_set_step_wave_item(bottom_item, edges, bottoms[channel_index], fill_level=center)
+
+    def _wave_draw_key(self, x, amplitudes) -> tuple | None:
+        if not isinstance(x, np.ndarray) or not isinstance(amplitudes, np.ndarray):
+            return None
+        return (
+            x.ctypes.data,
+            x.shape,
+            amplitudes.ctypes.data,
+            amplitudes.shape,
+            self._waveform_view_mode,
+            self._wave_top_color.rgba(),
+            self._wave_bottom_color.rgba(),
+        )
 
     def _set_waveform_from_channels(self, x: np.ndarray, amplitudes) -> None:
+        # Cache hits, view refreshes and theme passes often hand in the very arrays already on screen.
+        key = self._wave_draw_key(x, amplitudes)
+        last = self._last_draw
+        if key is not None and last is not None and last[0] == key:
+            return
+        # Holding the drawn arrays keeps their buffers alive, so an address in the key cannot be recycled.
+        self._last_draw = None if key is None else (key, x, amplitudes)
         x_arr, amp_arr = self._align_wave_channels(x, amplitudes)
         if x_arr.size == 0 or amp_arr.size == 0:
             self._clear_waveform_plot()
@@ -188,10 +297,14 @@ class WaveformController:
             return
 
         combined = self._combine_channels_to_single(amp_arr)
-        for top_item, bottom_item in self._channel_wave_items:
-            top_item.setData([], [], connect="all")
-            bottom_item.setData([], [], connect="all")
-        self._set_waveform_amplitude(x_arr, combined)
+        with self._batched_wave_update():
+            self._clear_channel_wave_items()
+            self._set_waveform_amplitude(x_arr, combined)
+
+    def _clear_channel_wave_items(self) -> None:
+        # One shared empty array: no per-item list conversion or allocation.
+        for item in self._channel_wave_items_flat:
+            item.setData(_EMPTY_F32, _EMPTY_F32, connect="all")
 
     def _set_waveform_amplitude(self, x: np.ndarray, amplitude: np.ndarray) -> None:
         x_arr, amp_arr = self._align_wave_arrays(x, amplitude)
@@ -221,15 +334,17 @@ class WaveformController:
 
         self._waveform_points = points
         self.wave_cache.clear()
+        self._edges_cache = None
+        self._current_channels = None
         self.wave_partial.clear()
 
         current_path = self._current_track_path()
-        self._stop_active_wave_worker(wait_ms=120)
-        self._stop_preload_worker(requeue=False, wait_ms=120)
+        self._stop_active_wave_worker()
+        self._stop_preload_worker(requeue=False)
 
         if current_path:
             self._load_waveform_for_track(current_path)
-            self._enqueue_preload([t.path for i, t in enumerate(self.tracks) if i != (self.current_index or 0)])
+            self._enqueue_preload_except(self.current_index)
 
         if save:
             self._save_preferences()
@@ -243,26 +358,25 @@ class WaveformController:
             return
 
         self._waveform_view_mode = mode
+        # Cached peaks are always per channel and the combined view folds them at draw time,
+        # so a switch is only a redraw: no cache entry goes stale and no track is decoded again.
         current_path = self._current_track_path()
-        if current_path:
-            signature = ""
-            try:
-                signature = self._file_signature(current_path, self._waveform_points)
-            except Exception:  # noqa: BLE001
-                signature = ""
-
-            cached = self._cache_get(current_path, signature)
-            if cached:
-                self._set_waveform_from_channels(cached[1], cached[2])
-            else:
-                if not self._render_partial_for_path(current_path, signature):
-                    self._clear_waveform_plot()
+        pinned = self._current_channels
+        if current_path and pinned is not None and pinned[0] == current_path:
+            self._set_waveform_from_channels(pinned[1], pinned[2])
+            self.wave_load_label.setText("")
+        elif current_path:
+            self._load_waveform_for_track(current_path)
         else:
             self._clear_waveform_plot()
 
         if save:
             self._save_preferences()
 
+    def _pin_current_channels(self, path: str, x: np.ndarray, amplitudes: np.ndarray) -> None:
+        # The loaded track's peaks serve both views, so a view switch redraws without a stat or cache probe.
+        self._current_channels = (path, x, amplitudes)
+
     def _fit_track_view(self) -> None:
         if self.duration_s <= 0:
             return
@@ -276,7 +390,7 @@ class WaveformController:
             return ""
         return self.tracks[self.current_index].path
 
-    def _render_partial_for_path(self, path: str, signature: str) -> bool:
+    def _render_partial_for_path(self, path: str, signature: tuple) -> bool:
         partial = self.wave_partial.get(path)
         if not partial or partial[0] != signature:
             return False
@@ -300,12 +414,13 @@ class WaveformController:
         try:
             signature = self._file_signature(path, self._waveform_points)
         except Exception:  # noqa: BLE001
-            signature = ""
+            signature = ()
 
         self._remove_from_preload_queue(path)
 
         cached = self._cache_get(path, signature)
         if cached:
+            self._pin_current_channels(path, cached[1], cached[2])
             self._set_waveform_from_channels(cached[1], cached[2])
             self.wave_load_label.setText("")
             self._start_next_preload()
@@ -318,8 +433,9 @@ class WaveformController:
             self.wave_load_label.setText("Waveform laden...")
             return
 
-        if self._preload_path == path and self._preload_thread is not None:
-            self._preload_thread.emit_progress = True
+        preload = self._preload_jobs.get(path)
+        if preload is not None:
+            preload[2].emit_progress = True
             if self._render_partial_for_path(path, signature):
                 return
             self._clear_waveform_plot()
@@ -333,67 +449,73 @@ class WaveformController:
             self._start_active_wave_worker(path, signature, emit_progress=True, points=self._waveform_points)
             return
 
-        if self._preload_thread is None:
+        if len(self._preload_jobs) < self._preload_limit:
             self._start_preload_wave_worker(path, signature, emit_progress=True, points=self._waveform_points)
             return
 
         if path not in self._preload_set:
-            self._preload_queue.insert(0, path)
+            self._preload_queue.appendleft(path)
             self._preload_set.add(path)
         self.wave_load_label.setText("Waveform in wachtrij...")
 
-    def _start_active_wave_worker(self, path: str, signature: str, emit_progress: bool, points: int) -> None:
+    def _start_active_wave_worker(self, path: str, signature: tuple, emit_progress: bool, points: int) -> None:
         self._active_wave_request_id += 1
         request_id = self._active_wave_request_id
         self._active_wave_path = path
         self._active_wave_signature = signature
         self._active_wave_failed = False
 
-        thread = WaveformJob(
+        job = WaveformJob(
             request_id=request_id,
             path=path,
             points=points,
             emit_progress=emit_progress,
             progress_interval=0.12,
+            cache_dir=self._waveform_cache_dir,
         )
-        thread.progressReady.connect(self._on_active_wave_progress)
-        thread.resultReady.connect(self._on_active_wave_finished)
-        thread.errorRaised.connect(self._on_active_wave_failed)
-        thread.finished.connect(lambda rid=request_id: self._on_active_wave_thread_finished(rid))
+        job.progressReady.connect(self._on_active_wave_progress)
+        job.resultReady.connect(self._on_active_wave_finished)
+        job.errorRaised.connect(self._on_active_wave_failed)
+        job.finished.connect(lambda rid=request_id: self._on_active_wave_thread_finished(rid))
 
-        self._active_wave_thread = thread
-        thread.start()
+        self._active_wave_thread = job
+        self._waveform_pool.submit(job)
 
-    def _start_preload_wave_worker(self, path: str, signature: str, emit_progress: bool, points: int) -> None:
+    def _start_preload_wave_worker(self, path: str, signature: tuple, emit_progress: bool, points: int) -> None:
         self._preload_request_id += 1
         request_id = self._preload_request_id
-        self._preload_path = path
-        self._preload_signature = signature
 
-        thread = WaveformJob(
+        job = WaveformJob(
             request_id=request_id,
             path=path,
             points=points,
             emit_progress=emit_progress,
             progress_interval=0.16,
+            cache_dir=self._waveform_cache_dir,
         )
-        thread.progressReady.connect(self._on_preload_progress)
-        thread.resultReady.connect(self._on_preload_finished)
-        thread.errorRaised.connect(self._on_preload_failed)
-        thread.finished.connect(lambda rid=request_id: self._on_preload_wave_thread_finished(rid))
-
-        self._preload_thread = thread
-        thread.start()
-
-    def _stop_active_wave_worker(self, wait_ms: int = 80) -> None:
+        job.progressReady.connect(self._on_preload_progress)
+        job.resultReady.connect(self._on_preload_finished)
+        job.errorRaised.connect(self._on_preload_failed)
+        job.finished.connect(lambda rid=request_id, p=path: self._on_preload_wave_thread_finished(rid, p))
+
+        self._preload_jobs[path] = (request_id, signature, job)
+        self._waveform_pool.submit(job)
+
+    def _preload_signature_for(self, request_id: int, path: str) -> tuple | None:
+        entry = self._preload_jobs.get(path)
+        if entry is None or entry[0] != request_id:
+            return None
+        return entry[1]
+
+    def _stop_active_wave_worker(self) -> None:
+        # Pool workers stay alive; the cancelled job exits at its next chunk and its late signals
+        # are dropped by the request id checks.
         if self._active_wave_thread is not None:
             self._active_wave_thread.cancel()
-            if not self._active_wave_thread.wait(wait_ms):
-                self._active_wave_thread.wait(3000)
 
         self._active_wave_thread = None
         self._active_wave_path = ""
-        self._active_wave_signature = ""
+        self._active_wave_signature = ()
         self._active_wave_failed = False
 
     @Slot(int, str, object, object, int, int)
@@ -409,7 +531,7 @@ class WaveformController:
         if request_id != self._active_wave_request_id or path != self._active_wave_path:
             return
 
-        x, amp = self._align_wave_channels(np.asarray(x_obj, dtype=np.float32), np.asarray(amp_obj, dtype=np.float32))
+        x, amp = self._align_wave_channels(_as_f32(x_obj), _as_f32(amp_obj))
         total_bins = int(total_bins)
         if total_bins <= 0:
             total_bins = max(1, amp.shape[0])
@@ -430,12 +552,13 @@ class WaveformController:
             return
 
         self._active_wave_failed = False
-        x, amplitudes = self._align_wave_channels(np.asarray(x_obj, dtype=np.float32), np.asarray(amp_obj, dtype=np.float32))
+        x, amplitudes = self._align_wave_channels(_as_f32(x_obj), _as_f32(amp_obj))
 
         self.wave_partial.pop(path, None)
         self._cache_store(path, self._active_wave_signature, x, amplitudes)
 
         if self._current_track_path() == path:
+            self._pin_current_channels(path, x, amplitudes)
             self._set_waveform_from_channels(x, amplitudes)
             self.wave_load_label.setText("")
 
@@ -462,7 +585,7 @@ class WaveformController:
 
         self._active_wave_thread = None
         self._active_wave_path = ""
-        self._active_wave_signature = ""
+        self._active_wave_signature = ()
         self._active_wave_failed = False
 
         if (
@@ -484,13 +607,12 @@ class WaveformController:
         self._start_next_preload()
 
     def _remove_from_preload_queue(self, path: str) -> None:
-        if path in self._preload_set:
-            self._preload_set.remove(path)
-            self._preload_queue = [p for p in self._preload_queue if p != path]
+        # _preload_set is the source of truth; the stale queue entry is skipped when it is popped.
+        self._preload_set.discard(path)
 
     def _enqueue_preload(self, paths: list[str]) -> None:
         for path in paths:
-            if path == self._active_wave_path or path == self._preload_path:
+            if path == self._active_wave_path or path in self._preload_jobs:
                 continue
             if path in self._preload_set:
                 continue
@@ -508,15 +630,23 @@ class WaveformController:
 
         self._start_next_preload()
 
-    def _start_next_preload(self) -> None:
-        if self._preload_thread is not None:
-            return
+    def _enqueue_preload_except(self, loaded_index: int | None) -> None:
+        # Row 0 is a real track; only None means nothing is loaded and every track is queued.
+        if loaded_index is None:
+            paths = [track.path for track in self.tracks]
+        else:
+            paths = [track.path for index, track in enumerate(self.tracks) if index != loaded_index]
+        self._enqueue_preload(paths)
 
-        while self._preload_queue:
-            path = self._preload_queue.pop(0)
+    def _start_next_preload(self) -> None:
+        # Results come back as queued signals, so wave_cache is only ever written on the GUI thread.
+        while self._preload_queue and len(self._preload_jobs) < self._preload_limit:
+            path = self._preload_queue.popleft()
+            if path not in self._preload_set:
+                continue
             self._preload_set.discard(path)
 
-            if path == self._active_wave_path:
+            if path == self._active_wave_path or path in self._preload_jobs:
                 continue
 
             try:
@@ -535,24 +665,21 @@ class WaveformController:
                 emit_progress=is_current,
                 points=self._waveform_points,
             )
-            return
-
-    def _stop_preload_worker(self, requeue: bool, wait_ms: int = 80) -> None:
-        path_to_requeue = self._preload_path if requeue else ""
-
-        if self._preload_thread is not None:
-            self._preload_thread.cancel()
-            if not self._preload_thread.wait(wait_ms):
-                self._preload_thread.wait(3000)
 
-        self._preload_thread = None
-
-        if requeue and path_to_requeue and path_to_requeue not in self._preload_set:
-            self._preload_queue.insert(0, path_to_requeue)
-            self._preload_set.add(path_to_requeue)
+    def _stop_preload_worker(self, requeue: bool, path: str | None = None) -> None:
+        paths = list(self._preload_jobs) if path is None else [path]
+        requeue_paths: list[str] = []
+        for preload_path in paths:
+            entry = self._preload_jobs.pop(preload_path, None)
+            if entry is None:
+                continue
+            entry[2].cancel()
+            if requeue and preload_path not in self._preload_set:
+                requeue_paths.append(preload_path)
 
-        self._preload_path = ""
-        self._preload_signature = ""
+        for preload_path in reversed(requeue_paths):
+            self._preload_queue.appendleft(preload_path)
+            self._preload_set.add(preload_path)
 
     @Slot(int, str, object, object, int, int)
     def _on_preload_progress(
@@ -564,15 +691,16 @@ class WaveformController:
         filled_bins: int,
         total_bins: int,
     ) -> None:
-        if request_id != self._preload_request_id or path != self._preload_path:
+        signature = self._preload_signature_for(request_id, path)
+        if signature is None:
             return
 
-        x, amp = self._align_wave_channels(np.asarray(x_obj, dtype=np.float32), np.asarray(amp_obj, dtype=np.float32))
+        x, amp = self._align_wave_channels(_as_f32(x_obj), _as_f32(amp_obj))
         total_bins = int(total_bins)
         if total_bins <= 0:
             total_bins = max(1, amp.shape[0])
         filled_bins = max(0, min(int(filled_bins), total_bins))
-        self.wave_partial[path] = (self._preload_signature, x, amp, filled_bins, total_bins)
+        self.wave_partial[path] = (signature, x, amp, filled_bins, total_bins)
 
         if self._current_track_path() == path:
             if (
@@ -580,25 +708,27 @@ class WaveformController:
                 and time.monotonic() < self._suppress_waveform_render_until
             ):
                 return
-            self._render_partial_for_path(path, self._preload_signature)
+            self._render_partial_for_path(path, signature)
 
     @Slot(int, str, object, object)
     def _on_preload_finished(self, request_id: int, path: str, x_obj, amp_obj) -> None:
-        if request_id != self._preload_request_id or path != self._preload_path:
+        signature = self._preload_signature_for(request_id, path)
+        if signature is None:
             return
 
-        x, amplitudes = self._align_wave_channels(np.asarray(x_obj, dtype=np.float32), np.asarray(amp_obj, dtype=np.float32))
+        x, amplitudes = self._align_wave_channels(_as_f32(x_obj), _as_f32(amp_obj))
 
         self.wave_partial.pop(path, None)
-        self._cache_store(path, self._preload_signature, x, amplitudes)
+        self._cache_store(path, signature, x, amplitudes)
 
         if self._current_track_path() == path:
+            self._pin_current_channels(path, x, amplitudes)
             self._set_waveform_from_channels(x, amplitudes)
             self.wave_load_label.setText("")
 
     @Slot(int, str, str)
     def _on_preload_failed(self, request_id: int, path: str, _error_message: str) -> None:
-        if request_id != self._preload_request_id or path != self._preload_path:
+        if self._preload_signature_for(request_id, path) is None:
             return
 
         self.wave_partial.pop(path, None)
@@ -606,11 +736,48 @@ class WaveformController:
             self._clear_waveform_plot()
             self.wave_load_label.setText("")
 
-    def _on_preload_wave_thread_finished(self, request_id: int) -> None:
-        if request_id != self._preload_request_id:
+    def _on_preload_wave_thread_finished(self, request_id: int, path: str) -> None:
+        if self._preload_signature_for(request_id, path) is None:
             return
 
-        self._preload_thread = None
-        self._preload_path = ""
-        self._preload_signature = ""
+        self._preload_jobs.pop(path, None)
         self._start_next_preload()
+
+    def _cleanup_waveform_disk_cache(self, max_age_s: int, max_entries: int, tmp_grace_s: int = 3600) -> None:
+        cache_dir = getattr(self, "_waveform_cache_dir", None)
+        if not cache_dir:
+            return
+        now = time.time()
+        entries: list[tuple[float, Path]] = []
+        try:
+            for candidate in cache_dir.iterdir():
+                try:
+                    mtime = candidate.stat().st_mtime
+                    if candidate.suffix != ".npz":
+                        # Another running instance may be mid-store; only abandoned temp files go.
+                        if now - mtime > tmp_grace_s:
+                            candidate.unlink()
+                        continue
+                    if now - mtime > max_age_s:
+                        candidate.unlink()
+                        continue
+                except OSError:
+                    continue
+                entries.append((mtime, candidate))
+        except OSError:
+            return
+        if len(entries) <= max_entries:
+            return
+        entries.sort(key=lambda entry: entry[0])
+        for _mtime, candidate in entries[: len(entries) - max_entries]:
+            try:
+                candidate.unlink()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _pack_wave_amplitudes(amplitudes: np.ndarray) -> np.ndarray:
+        # Cached envelopes stay in RAM as int16 and only become float32 again in _align_wave_channels.
+        packed = quantize_wave_amplitudes(_as_f32(amplitudes))
+        packed.flags.writeable = False
+        return packed
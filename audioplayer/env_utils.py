@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import os
+import re
+import stat
 import sys
 from pathlib import Path
 
+# Same keys as a split on the first "=": anything non-empty before it, except comment lines.
+_ENV_LINE_RE = re.compile(rb"(?m)^[ \t]*(?:export[ \t]+)?([^\s=#][^=\r\n]*?)[ \t]*=(.*)$")
+
 
 def _parse_dotenv_value(raw_value: str) -> str:
     value = raw_value.strip()
@@ -13,26 +18,19 @@ def _parse_dotenv_value(raw_value: str) -> str:
 
 
 def _load_dotenv_file(path: Path) -> None:
-    if not path.is_file():
-        return
+    # Runs before the window is shown: one stat and one raw read per candidate, decoding only kept entries.
+    path_str = str(path)
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        if not stat.S_ISREG(os.stat(path_str).st_mode):
+            return
+        with open(path_str, "rb") as handle:
+            data = handle.read()
     except Exception:  # noqa: BLE001
         return
 
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        if stripped.startswith("export "):
-            stripped = stripped[7:].strip()
-        if "=" not in stripped:
-            continue
-        key, raw_value = stripped.split("=", 1)
-        env_key = key.strip()
-        if not env_key:
-            continue
-        env_value = _parse_dotenv_value(raw_value)
+    for match in _ENV_LINE_RE.finditer(data):
+        env_key = match.group(1).decode("utf-8", "replace")
+        env_value = _parse_dotenv_value(match.group(2).decode("utf-8", "replace"))
         os.environ.setdefault(env_key, env_value)
 
 
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import functools
 import json
 import os
 import tempfile
 import textwrap
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Callable
 
 import numpy as np
 import pyqtgraph as pg
-from PySide6.QtCore import QEvent, QSettings, Qt, QTimer, Signal
+from PySide6.QtCore import QEvent, QSettings, Qt, QThreadPool, QTimer, Signal
 from PySide6.QtGui import (
     QAction,
     QActionGroup,
@@ -18,6 +20,7 @@ from PySide6.QtGui import (
     QDragEnterEvent,
     QDragMoveEvent,
     QDropEvent,
+    QGuiApplication,
     QIcon,
     QKeySequence,
     QPen,
@@ -55,11 +58,10 @@ from audioplayer.constants import (
     FEEDBACK_WORKER_ENV_KEY,
     FEEDBACK_WORKER_ENV_URL,
     MIDI_ACTION_IDS,
-    ROUTING_CHANNEL_LABELS,
 )
 from audioplayer.controllers import AudioRoutingController, MidiController, PlaybackController, PlaylistController, WaveformController
 from audioplayer.models import Track
-from audioplayer.services.feedback_service import post_feedback_issue
+from audioplayer.services.feedback_service import FeedbackWorker
 from audioplayer.ui.settings_dialog import open_settings_dialog as open_settings_dialog_view
 from audioplayer.ui.theme import (
     build_auto_next_icon,
@@ -74,9 +76,20 @@ from audioplayer.ui.theme import (
     resolve_playhead_color,
     system_prefers_dark,
 )
-from audioplayer.waveform import TimeAxisItem, WaveformJob
+from audioplayer.waveform import TimeAxisItem, WaveformJob, WaveformWorkerPool, warm_wave_kernels
 from audioplayer.widgets import PlaylistWidget
 
+_DURATION_CACHE_LIMIT = 2000
+_INFO_WRAPPER = textwrap.TextWrapper(width=26, break_long_words=True, break_on_hyphens=True)
+
+
+@functools.lru_cache(maxsize=128)
+def _wrap_info_value(value: str) -> str:
+    # Short, already-clean values come out of TextWrapper unchanged, so skip it for those.
+    if len(value) <= _INFO_WRAPPER.width and value.isprintable() and value == value.strip():
+        return value
+    return _INFO_WRAPPER.fill(value)
+
 
 class WaveformPlayer(QMainWindow):
     midiNoteReceived = Signal(int)
@@ -107,11 +120,18 @@ class WaveformPlayer(QMainWindow):
         self._settings = QSettings("RicoVanderhallen", "AudioPlayer")
         self._language = "nl"
         self._accent_color = "#7ED298"
-        self._effective_accent_color = ""
         self._default_theme_mode = "system"
         self._theme_mode = "system"
         self._effective_theme = ""
+        self._theme_fingerprint: tuple[str, str, str, float] | None = None
+        self._system_dark_cache: bool | None = None
+        self._applied_style_key: tuple[str, int] | None = None
+        self._theme_palette_cache: dict[tuple[str, int], dict[str, object]] = {}
         self._applying_theme = False
+        self._theme_apply_pending = False
+        self._icon_cache: dict[tuple, QIcon] = {}
+        self._toggle_tooltips: dict[str, str] = {}
+        self._toggle_tooltips_language = ""
         self._last_ui_ms = -10_000
         self._default_repeat_mode = "off"
         self._repeat_mode = "off"
@@ -123,12 +143,11 @@ class WaveformPlayer(QMainWindow):
         self._follow_playhead = True
         self._playhead_color = ""
         self._playhead_width = 2.0
-        self._effective_playhead_color = ""
-        self._effective_playhead_width = 0.0
         self._waveform_points = 4200
         self._waveform_view_mode = "combined"
         self._audio_output_device_key = ""
         self._effective_audio_route_note = ""
+        self._audio_outputs_cache: tuple[list[QAudioDevice], QAudioDevice] | None = None
         self._midi_enabled = False
         self._midi_input_name = ""
         self._midi_channel = -1
@@ -142,48 +161,71 @@ class WaveformPlayer(QMainWindow):
         self._wave_bottom_color = QColor("#49a9de")
         self._wave_fill_color = QColor(93, 183, 234, 110)
 
+        # One worker stays free for the active track while the others preload in parallel.
+        self._preload_limit = max(1, min(4, os.cpu_count() or 1))
+        self._waveform_pool = WaveformWorkerPool(worker_count=self._preload_limit + 1)
+        QThreadPool.globalInstance().start(warm_wave_kernels)
         self._active_wave_request_id = 0
         self._active_wave_thread: WaveformJob | None = None
         self._active_wave_path = ""
-        self._active_wave_signature = ""
+        self._active_wave_signature: tuple = ()
         self._active_wave_failed = False
 
         self._preload_request_id = 0
-        self._preload_thread: WaveformJob | None = None
-        self._preload_path = ""
-        self._preload_signature = ""
-        self._preload_queue: list[str] = []
+        self._preload_jobs: dict[str, tuple[int, tuple, WaveformJob]] = {}
+        self._preload_queue: deque[str] = deque()
         self._preload_set: set[str] = set()
 
-        self.wave_cache: dict[str, tuple[str, np.ndarray, np.ndarray]] = {}
-        self.wave_partial: dict[str, tuple[str, np.ndarray, np.ndarray, int, int]] = {}
-        self._duration_cache: dict[str, float] = {}
+        self.wave_cache: OrderedDict[str, tuple[tuple, np.ndarray, np.ndarray]] = OrderedDict()
+        self.wave_partial: dict[str, tuple[tuple, np.ndarray, np.ndarray, int, int]] = {}
+        self._edges_cache: tuple[tuple, np.ndarray] | None = None
+        self._last_draw: tuple[tuple, np.ndarray, np.ndarray] | None = None
+        self._current_channels: tuple[str, np.ndarray, np.ndarray] | None = None
+        self._duration_cache: dict[str, tuple[tuple, float]] = {}
         self._channel_wave_items: list[tuple[pg.PlotDataItem, pg.PlotDataItem]] = []
+        self._channel_wave_items_flat: list[pg.PlotDataItem] = []
+        self._channel_style_key: tuple[int, int, int, int] | None = None
         self._routed_audio_cache: dict[str, str] = {}
         self._session_routed_files: set[str] = set()
         self._routed_audio_dir = Path(tempfile.gettempdir()) / "AudioPlayer" / "routed"
         self._routed_audio_dir.mkdir(parents=True, exist_ok=True)
+        self._waveform_cache_dir = self._routed_audio_dir.parent / "waveforms"
+        self._waveform_cache_dir.mkdir(parents=True, exist_ok=True)
         self.waveform_controller = WaveformController(self)
         self.playback_controller = PlaybackController(self)
         self.playlist_controller = PlaylistController(self)
         self.audio_routing_controller = AudioRoutingController(self)
         self.midi_controller = MidiController(self)
         self._cleanup_stale_routed_files(max_age_s=18 * 3600)
+        self._cleanup_waveform_disk_cache(max_age_s=30 * 24 * 3600, max_entries=400)
 
         self.sun_icon = self._build_sun_icon()
         self.moon_icon = self._build_moon_icon()
 
+        self._save_preferences_timer = QTimer(self)
+        self._save_preferences_timer.setSingleShot(True)
+        self._save_preferences_timer.setInterval(250)
+        self._save_preferences_timer.timeout.connect(self._save_preferences_now)
+
         self._load_preferences()
         self._build_ui()
         self._connect_signals()
         self._apply_language()
         self.set_theme_mode(self._theme_mode)
+        # Style the window before it is first shown rather than on the first event-loop pass.
+        self._run_scheduled_theme_apply()
         self._refresh_midi_input(update_status=False)
 
-        self._system_theme_timer = QTimer(self)
-        self._system_theme_timer.setInterval(1200)
-        self._system_theme_timer.timeout.connect(self._refresh_system_theme)
-        self._system_theme_timer.start()
+        self._system_theme_timer: QTimer | None = None
+        color_scheme_changed = getattr(QGuiApplication.styleHints(), "colorSchemeChanged", None)
+        if color_scheme_changed is not None:
+            color_scheme_changed.connect(self._on_system_color_scheme_changed)
+        else:
+            # Qt before 6.5 has no scheme signal; palette events cover most platforms, the poll the rest.
+            self._system_theme_timer = QTimer(self)
+            self._system_theme_timer.setInterval(1200)
+            self._system_theme_timer.timeout.connect(self._poll_system_theme)
+            self._system_theme_timer.start()
 
     def _build_ui(self) -> None:
         toolbar = QToolBar("Main")
@@ -492,9 +534,12 @@ class WaveformPlayer(QMainWindow):
 
     def closeEvent(self, event) -> None:  # noqa: N802
         self._close_midi_input()
-        self._stop_active_wave_worker(wait_ms=1500)
-        self._stop_preload_worker(requeue=False, wait_ms=1500)
+        self._stop_active_wave_worker()
+        self._stop_preload_worker(requeue=False)
+        self._waveform_pool.shutdown(wait_ms=1500)
         self._cleanup_session_routed_files()
+        self._flush_preferences()
+        self._save_duration_cache()
         super().closeEvent(event)
 
     def changeEvent(self, event) -> None:  # noqa: N802
@@ -508,6 +553,8 @@ class WaveformPlayer(QMainWindow):
             watched.add(theme_change)
 
         if event.type() in watched:
+            self._icon_cache.clear()
+            self._invalidate_system_theme_cache()
             self._refresh_system_theme()
 
     @staticmethod
@@ -518,46 +565,6 @@ class WaveformPlayer(QMainWindow):
             return default
         return str(value).strip().lower() in {"1", "true", "yes", "on"}
 
-    @staticmethod
-    def _default_routing_matrix() -> list[list[int]]:
-        size = len(ROUTING_CHANNEL_LABELS)
-        matrix = [[0 for _ in range(size)] for _ in range(size)]
-        for idx in range(size):
-            matrix[idx][idx] = 1
-        return matrix
-
-    @staticmethod
-    def _clone_routing_matrix(matrix: list[list[int]]) -> list[list[int]]:
-        size = len(ROUTING_CHANNEL_LABELS)
-        out = [[0 for _ in range(size)] for _ in range(size)]
-        for row_idx in range(min(size, len(matrix))):
-            row = matrix[row_idx]
-            for col_idx in range(min(size, len(row))):
-                out[row_idx][col_idx] = 1 if int(row[col_idx]) else 0
-        return out
-
-    @staticmethod
-    def _serialize_routing_matrix(matrix: list[list[int]]) -> str:
-        safe = WaveformPlayer._clone_routing_matrix(matrix)
-        rows: list[str] = []
-        for row in safe:
-            rows.append("".join("1" if int(cell) else "0" for cell in row))
-        return "|".join(rows)
-
-    @staticmethod
-    def _parse_routing_matrix(raw: str) -> list[list[int]]:
-        if not raw:
-            return WaveformPlayer._default_routing_matrix()
-
-        size = len(ROUTING_CHANNEL_LABELS)
-        rows = [segment for segment in raw.split("|") if segment]
-        matrix = [[0 for _ in range(size)] for _ in range(size)]
-        for row_idx in range(min(size, len(rows))):
-            row_text = rows[row_idx]
-            for col_idx in range(min(size, len(row_text))):
-                matrix[row_idx][col_idx] = 1 if row_text[col_idx] == "1" else 0
-        return matrix
-
     @staticmethod
     def _default_midi_note_map() -> dict[str, int]:
         return {
@@ -630,49 +637,6 @@ class WaveformPlayer(QMainWindow):
     def _trigger_midi_action(self, action_id: str) -> None:
         return self.midi_controller._trigger_midi_action(action_id)
 
-    @staticmethod
-    def _routing_matrix_target_channels(matrix: list[list[int]]) -> int:
-        size = len(ROUTING_CHANNEL_LABELS)
-        highest = -1
-        for row in range(min(size, len(matrix))):
-            current = matrix[row]
-            for col in range(min(size, len(current))):
-                if int(current[col]):
-                    highest = max(highest, col)
-        return highest + 1
-
-    @staticmethod
-    def _routing_matrix_preset(target_channels: int) -> list[list[int]]:
-        size = len(ROUTING_CHANNEL_LABELS)
-        matrix = [[0 for _ in range(size)] for _ in range(size)]
-        if target_channels <= 0:
-            return WaveformPlayer._default_routing_matrix()
-        target = max(1, min(size, int(target_channels)))
-        if target == 2:
-            # Simple stereo fold-down routing.
-            left_sources = {0, 2, 4, 6, 8, 10}
-            right_sources = {1, 2, 5, 7, 9, 11}
-            for src in left_sources:
-                matrix[src][0] = 1
-            for src in right_sources:
-                matrix[src][1] = 1
-            matrix[3][0] = 1
-            matrix[3][1] = 1
-            return matrix
-        for idx in range(size):
-            matrix[idx][min(idx, target - 1)] = 1
-        return matrix
-
-    @staticmethod
-    def _is_identity_routing(matrix: np.ndarray) -> bool:
-        if matrix.ndim != 2 or matrix.size == 0:
-            return False
-        rows, cols = matrix.shape
-        if rows != cols:
-            return False
-        eye = np.eye(rows, dtype=np.float32)
-        return np.array_equal(np.asarray(matrix, dtype=np.float32), eye)
-
     def _routing_requires_processing(self) -> bool:
         return self.audio_routing_controller._routing_requires_processing()
 
@@ -688,6 +652,12 @@ class WaveformPlayer(QMainWindow):
     def _cleanup_stale_routed_files(self, max_age_s: int) -> None:
         return self.audio_routing_controller._cleanup_stale_routed_files(max_age_s)
 
+    def _cleanup_waveform_disk_cache(self, max_age_s: int, max_entries: int) -> None:
+        return self.waveform_controller._cleanup_waveform_disk_cache(max_age_s, max_entries)
+
+    def _pack_wave_amplitudes(self, amplitudes: np.ndarray) -> np.ndarray:
+        return self.waveform_controller._pack_wave_amplitudes(amplitudes)
+
     def _trim_routed_audio_cache(self, max_entries: int) -> None:
         return self.audio_routing_controller._trim_routed_audio_cache(max_entries)
 
@@ -713,9 +683,15 @@ class WaveformPlayer(QMainWindow):
     def _routing_mode_label(self, mode: str) -> str:
         return self.audio_routing_controller._routing_mode_label(mode)
 
+    def _cached_audio_outputs(self) -> tuple[list[QAudioDevice], QAudioDevice] | None:
+        return self.audio_routing_controller._cached_audio_outputs()
+
     def _audio_output_devices(self) -> list[QAudioDevice]:
         return self.audio_routing_controller._audio_output_devices()
 
+    def _default_audio_output(self) -> QAudioDevice:
+        return self.audio_routing_controller._default_audio_output()
+
     def _resolve_audio_device(
         self,
         preferred_key: str,
@@ -755,72 +731,78 @@ class WaveformPlayer(QMainWindow):
         return self.audio_routing_controller._refresh_current_playback_source()
 
     def _load_preferences(self) -> None:
-        language = str(self._settings.value("language", self._language))
+        # One key listing up front; missing keys then resolve to their default without a backend lookup.
+        stored_keys = set(self._settings.allKeys())
+
+        def setting(key: str, default):
+            return self._settings.value(key, default) if key in stored_keys else default
+
+        language = str(setting("language", self._language))
         if language in {"nl", "en"}:
             self._language = language
 
-        accent = str(self._settings.value("accent_color", self._accent_color))
+        accent = str(setting("accent_color", self._accent_color))
         if QColor(accent).isValid():
             self._accent_color = accent
 
-        theme = str(self._settings.value("default_theme", self._default_theme_mode))
+        theme = str(setting("default_theme", self._default_theme_mode))
         if theme in {"system", "dark", "light"}:
             self._default_theme_mode = theme
 
-        repeat = str(self._settings.value("default_repeat", self._default_repeat_mode))
+        repeat = str(setting("default_repeat", self._default_repeat_mode))
         if repeat in {"off", "one", "all"}:
             self._default_repeat_mode = repeat
 
         self._default_auto_continue_enabled = self._to_bool(
-            self._settings.value("default_auto_continue", self._default_auto_continue_enabled),
+            setting("default_auto_continue", self._default_auto_continue_enabled),
             self._default_auto_continue_enabled,
         )
         self._default_autoplay_on_add = self._to_bool(
-            self._settings.value("default_autoplay_on_add", self._default_autoplay_on_add),
+            setting("default_autoplay_on_add", self._default_autoplay_on_add),
             self._default_autoplay_on_add,
         )
         self._default_follow_playhead = self._to_bool(
-            self._settings.value(
+            setting(
                 "default_follow_playhead",
-                self._settings.value("follow_playhead", self._default_follow_playhead),
+                setting("follow_playhead", self._default_follow_playhead),
             ),
             self._default_follow_playhead,
         )
 
-        playhead_color = str(self._settings.value("playhead_color", self._playhead_color)).strip()
+        playhead_color = str(setting("playhead_color", self._playhead_color)).strip()
         self._playhead_color = playhead_color if playhead_color and QColor(playhead_color).isValid() else ""
         try:
-            width_value = float(self._settings.value("playhead_width", self._playhead_width))
+            width_value = float(setting("playhead_width", self._playhead_width))
             self._playhead_width = max(1.0, min(width_value, 6.0))
         except Exception:  # noqa: BLE001
             self._playhead_width = 2.0
 
         try:
-            points_value = int(self._settings.value("waveform_points", self._waveform_points))
+            points_value = int(setting("waveform_points", self._waveform_points))
             self._waveform_points = max(1200, min(points_value, 24000))
         except Exception:  # noqa: BLE001
             self._waveform_points = 4200
-        waveform_view_mode = str(self._settings.value("waveform_view_mode", self._waveform_view_mode))
+        waveform_view_mode = str(setting("waveform_view_mode", self._waveform_view_mode))
         if waveform_view_mode in {"combined", "channels"}:
             self._waveform_view_mode = waveform_view_mode
 
-        audio_output_device = str(self._settings.value("audio_output_device", self._audio_output_device_key)).strip().lower()
+        audio_output_device = str(setting("audio_output_device", self._audio_output_device_key)).strip().lower()
         if len(audio_output_device) % 2 == 0 and all(ch in "0123456789abcdef" for ch in audio_output_device):
             self._audio_output_device_key = audio_output_device
         else:
             self._audio_output_device_key = ""
 
         self._midi_enabled = self._to_bool(
-            self._settings.value("midi_enabled", self._midi_enabled),
+            setting("midi_enabled", self._midi_enabled),
             self._midi_enabled,
         )
-        self._midi_input_name = str(self._settings.value("midi_input_name", self._midi_input_name)).strip()
+        self._midi_input_name = str(setting("midi_input_name", self._midi_input_name)).strip()
         try:
-            midi_channel_value = int(self._settings.value("midi_channel", self._midi_channel))
+            midi_channel_value = int(setting("midi_channel", self._midi_channel))
         except Exception:  # noqa: BLE001
             midi_channel_value = -1
         self._midi_channel = midi_channel_value if -1 <= midi_channel_value <= 15 else -1
-        midi_map_raw = str(self._settings.value("midi_note_map", ""))
+        midi_map_raw = str(setting("midi_note_map", ""))
         midi_map_value: dict[str, int] = self._default_midi_note_map()
         if midi_map_raw:
             try:
@@ -829,6 +811,19 @@ class WaveformPlayer(QMainWindow):
                 parsed_map = {}
             midi_map_value = self._normalize_midi_note_map(parsed_map)
         self._midi_note_map = midi_map_value
+        durations_raw = str(setting("track_durations", ""))
+        if durations_raw:
+            try:
+                parsed_durations = json.loads(durations_raw)
+            except Exception:  # noqa: BLE001
+                parsed_durations = {}
+            if isinstance(parsed_durations, dict):
+                for path, entry in parsed_durations.items():
+                    try:
+                        signature, duration = entry
+                        self._duration_cache[str(path)] = (tuple(int(part) for part in signature), float(duration))
+                    except Exception:  # noqa: BLE001
+                        continue
 
         self._theme_mode = self._default_theme_mode
         self._repeat_mode = self._default_repeat_mode
@@ -837,6 +832,15 @@ class WaveformPlayer(QMainWindow):
         self._follow_playhead = self._default_follow_playhead
 
     def _save_preferences(self) -> None:
+        # Bursts of toggles (repeat cycling, view switches) collapse into one settings write.
+        self._save_preferences_timer.start()
+
+    def _flush_preferences(self) -> None:
+        if self._save_preferences_timer.isActive():
+            self._save_preferences_timer.stop()
+            self._save_preferences_now()
+
+    def _save_preferences_now(self) -> None:
         self._settings.setValue("language", self._language)
         self._settings.setValue("accent_color", self._accent_color)
         self._settings.setValue("default_theme", self._default_theme_mode)
@@ -854,15 +858,37 @@ class WaveformPlayer(QMainWindow):
         self._settings.setValue("midi_channel", self._midi_channel)
         self._settings.setValue("midi_note_map", json.dumps(self._normalize_midi_note_map(self._midi_note_map), sort_keys=True))
 
+    def _save_duration_cache(self) -> None:
+        # Sorting by time on a cold playlist opens every file; keep the most recently used entries
+        # (the cache is kept in last-use order) for the next session.
+        entries = list(self._duration_cache.items())[-_DURATION_CACHE_LIMIT:]
+        payload = {path: [signature, duration] for path, (signature, duration) in entries if signature}
+        self._settings.setValue("track_durations", json.dumps(payload, separators=(",", ":")))
+
     def _txt(self, nl_text: str, en_text: str) -> str:
         return en_text if self._language == "en" else nl_text
 
+    def _invalidate_system_theme_cache(self) -> None:
+        self._system_dark_cache = None
+
+    def _on_system_color_scheme_changed(self, _scheme) -> None:
+        self._invalidate_system_theme_cache()
+        self._refresh_system_theme()
+
+    def _poll_system_theme(self) -> None:
+        # Compare with the cached answer instead of dropping it, so unchanged ticks re-apply nothing.
+        prefers_dark = system_prefers_dark(self)
+        if prefers_dark == self._system_dark_cache:
+            return
+        self._system_dark_cache = prefers_dark
+        self._refresh_system_theme()
+
     def _refresh_system_theme(self) -> None:
         if self._theme_mode != "system" or self._applying_theme:
             return
         effective = "dark" if self._system_prefers_dark() else "light"
         if effective != self._effective_theme:
-            self._apply_effective_theme()
+            self._schedule_theme_apply()
 
     def _new_info_value(self) -> QLabel:
         lbl = QLabel("-")
@@ -881,8 +907,7 @@ class WaveformPlayer(QMainWindow):
         info_layout.addRow(key_label, value_label)
 
     def _set_info_value(self, label: QLabel, value: str) -> None:
-        wrapped = textwrap.fill(value, width=26, break_long_words=True, break_on_hyphens=True)
-        label.setText(wrapped)
+        label.setText(_wrap_info_value(value))
         label.setToolTip(value)
 
     def _clear_track_ui(self) -> None:
@@ -899,11 +924,10 @@ class WaveformPlayer(QMainWindow):
         self._set_info_value(self.lbl_size, "-")
 
     def _clear_waveform_plot(self) -> None:
+        self._last_draw = None
         self.wave_top.setData([], [], connect="all")
         self.wave_bottom.setData([], [], connect="all")
-        for wave_top_item, wave_bottom_item in self._channel_wave_items:
-            wave_top_item.setData([], [], connect="all")
-            wave_bottom_item.setData([], [], connect="all")
+        self._clear_channel_wave_items()
 
     def _align_wave_arrays(self, x: np.ndarray, amplitude: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         return self.waveform_controller._align_wave_arrays(x, amplitude)
@@ -927,13 +951,15 @@ class WaveformPlayer(QMainWindow):
     def _compute_wave_edges(self, x_values: np.ndarray) -> np.ndarray:
         return self.waveform_controller._compute_wave_edges(x_values)
 
-    
-    def _combine_channels_to_single(amplitudes: np.ndarray) -> np.ndarray:
-        return WaveformController._combine_channels_to_single(amplitudes)
+    def _combine_channels_to_single(self, amplitudes: np.ndarray) -> np.ndarray:
+        return self.waveform_controller._combine_channels_to_single(amplitudes)
 
     def _ensure_channel_wave_items(self, channel_count: int) -> None:
         return self.waveform_controller._ensure_channel_wave_items(channel_count)
 
+    def _clear_channel_wave_items(self) -> None:
+        return self.waveform_controller._clear_channel_wave_items()
+
     def _apply_channel_wave_item_styles(self) -> None:
         return self.waveform_controller._apply_channel_wave_item_styles()
 
@@ -1030,8 +1056,10 @@ class WaveformPlayer(QMainWindow):
         details: str,
         reporter_name: str,
         guest_mode: bool,
-    ) -> tuple[bool, str, str]:
-        return post_feedback_issue(
+        on_finished: Callable[[bool, str, str], None],
+    ) -> FeedbackWorker:
+        # The POST can stall for its full timeout, so it runs on the global pool instead of the GUI thread.
+        worker = FeedbackWorker(
             issue_kind=issue_kind,
             title=title,
             details=details,
@@ -1042,6 +1070,9 @@ class WaveformPlayer(QMainWindow):
             worker_key=self._feedback_worker_key,
             txt=self._txt,
         )
+        worker.signals.finished.connect(on_finished)
+        QThreadPool.globalInstance().start(worker)
+        return worker
 
     def open_feedback_dialog(self) -> None:
         dialog = QDialog(self)
@@ -1111,20 +1142,14 @@ class WaveformPlayer(QMainWindow):
             cancel_button.setText(self._txt("Annuleren", "Cancel"))
         layout.addWidget(button_box)
 
-        def submit_feedback() -> None:
-            issue_kind = str(issue_type_combo.currentData() or "bug")
-            title = title_edit.text().strip()
-            details = details_edit.toPlainText().strip()
-            guest_mode = guest_checkbox.isChecked()
-            reporter_name = reporter_edit.text().strip()
+        pending: list[FeedbackWorker] = []
 
-            ok, message, issue_url = self._post_feedback_issue(
-                issue_kind,
-                title,
-                details,
-                reporter_name,
-                guest_mode,
-            )
+        def feedback_finished(ok: bool, message: str, issue_url: str) -> None:
+            pending.clear()
+            if submit_button is not None:
+                submit_button.setEnabled(True)
+            if not dialog.isVisible():
+                return
             if not ok:
                 QMessageBox.warning(dialog, self._txt("Feedback verzenden mislukt", "Feedback submit failed"), message)
                 return
@@ -1134,6 +1159,28 @@ class WaveformPlayer(QMainWindow):
             QMessageBox.information(dialog, self._txt("Feedback verstuurd", "Feedback sent"), message)
             dialog.accept()
 
+        def submit_feedback() -> None:
+            if pending:
+                return
+            issue_kind = str(issue_type_combo.currentData() or "bug")
+            title = title_edit.text().strip()
+            details = details_edit.toPlainText().strip()
+            guest_mode = guest_checkbox.isChecked()
+            reporter_name = reporter_edit.text().strip()
+
+            if submit_button is not None:
+                submit_button.setEnabled(False)
+            pending.append(
+                self._post_feedback_issue(
+                    issue_kind,
+                    title,
+                    details,
+                    reporter_name,
+                    guest_mode,
+                    feedback_finished,
+                )
+            )
+
         button_box.accepted.connect(submit_feedback)
         button_box.rejected.connect(dialog.reject)
         dialog.exec()
@@ -1153,12 +1200,24 @@ class WaveformPlayer(QMainWindow):
     def remove_selected_track(self) -> None:
         return self.playlist_controller.remove_selected_track()
 
+    def _duration_signature(self, path: str) -> tuple:
+        return self.playlist_controller._duration_signature(path)
+
     def _track_duration(self, path: str) -> float:
         return self.playlist_controller._track_duration(path)
 
+    def _remember_duration(self, path: str, signature: tuple, duration: float) -> None:
+        return self.playlist_controller._remember_duration(path, signature, duration)
+
+    def _track_durations(self, paths: list[str]) -> list[float]:
+        return self.playlist_controller._track_durations(paths)
+
     def _rebuild_playlist_items(self, selected_path: str) -> None:
         return self.playlist_controller._rebuild_playlist_items(selected_path)
 
+    def _reorder_playlist_items(self, order: list[int], selected_path: str) -> None:
+        return self.playlist_controller._reorder_playlist_items(order, selected_path)
+
     def sort_playlist_by_name(self) -> None:
         return self.playlist_controller.sort_playlist_by_name()
 
@@ -1171,15 +1230,27 @@ class WaveformPlayer(QMainWindow):
     def _sync_tracks_from_playlist(self) -> None:
         return self.playlist_controller._sync_tracks_from_playlist()
 
+    def _toggle_tooltip(self, key: str, fallback: str = "") -> str:
+        # Toggle buttons refresh their tooltip on every click; translate the set once per language.
+        if self._toggle_tooltips_language != self._language:
+            self._toggle_tooltips = {
+                "repeat_off": self._txt("Repeat: uit", "Repeat: off"),
+                "repeat_one": self._txt("Repeat: huidige track", "Repeat: current track"),
+                "repeat_all": self._txt("Repeat: hele playlist", "Repeat: whole playlist"),
+                "auto_next_on": self._txt(
+                    "Auto next: aan (ga automatisch naar volgende track)", "Auto next: on (go to next track)"
+                ),
+                "auto_next_off": self._txt("Auto next: uit (stop op einde van track)", "Auto next: off (stop at track end)"),
+                "follow_on": self._txt("Playhead volgen: aan", "Follow playhead: on"),
+                "follow_off": self._txt("Playhead volgen: uit", "Follow playhead: off"),
+            }
+            self._toggle_tooltips_language = self._language
+        return self._toggle_tooltips.get(key, fallback)
+
     def _update_repeat_button_text(self) -> None:
         self.repeat_button.setText("")
         self.repeat_button.setIcon(self._build_repeat_mode_icon(self._repeat_mode))
-        tooltip_map = {
-            "off": self._txt("Repeat: uit", "Repeat: off"),
-            "one": self._txt("Repeat: huidige track", "Repeat: current track"),
-            "all": self._txt("Repeat: hele playlist", "Repeat: whole playlist"),
-        }
-        self.repeat_button.setToolTip(tooltip_map.get(self._repeat_mode, "Repeat: uit"))
+        self.repeat_button.setToolTip(self._toggle_tooltip(f"repeat_{self._repeat_mode}", "Repeat: uit"))
 
     def _cycle_repeat_mode(self) -> None:
         order = ("off", "one", "all")
@@ -1197,11 +1268,7 @@ class WaveformPlayer(QMainWindow):
             self.auto_next_button.setChecked(enabled)
         self.auto_next_button.setText("")
         self.auto_next_button.setIcon(self._build_auto_next_icon(enabled))
-        self.auto_next_button.setToolTip(
-            self._txt("Auto next: aan (ga automatisch naar volgende track)", "Auto next: on (go to next track)")
-            if enabled
-            else self._txt("Auto next: uit (stop op einde van track)", "Auto next: off (stop at track end)")
-        )
+        self.auto_next_button.setToolTip(self._toggle_tooltip("auto_next_on" if enabled else "auto_next_off"))
         if save:
             self._save_preferences()
 
@@ -1212,11 +1279,7 @@ class WaveformPlayer(QMainWindow):
             self.follow_button.setChecked(enabled)
         self.follow_button.setText("")
         self.follow_button.setIcon(self._build_follow_icon(enabled))
-        self.follow_button.setToolTip(
-            self._txt("Playhead volgen: aan", "Follow playhead: on")
-            if enabled
-            else self._txt("Playhead volgen: uit", "Follow playhead: off")
-        )
+        self.follow_button.setToolTip(self._toggle_tooltip("follow_on" if enabled else "follow_off"))
         if save:
             self._save_preferences()
 
@@ -1230,14 +1293,24 @@ class WaveformPlayer(QMainWindow):
     def _build_light_style(self, accent: QColor) -> str:
         return build_light_style(accent)
 
+    def _cached_state_icon(self, builder: Callable[..., QIcon], state) -> QIcon:
+        # Toggles repaint the same handful of 20x20 icons; reuse them until the palette changes.
+        color = self.palette().buttonText().color()
+        key = (builder, state, color.rgba())
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = builder(state, color)
+            self._icon_cache[key] = icon
+        return icon
+
     def _build_repeat_mode_icon(self, mode: str) -> QIcon:
-        return build_repeat_mode_icon(mode, self.palette().buttonText().color())
+        return self._cached_state_icon(build_repeat_mode_icon, mode)
 
     def _build_auto_next_icon(self, enabled: bool) -> QIcon:
-        return build_auto_next_icon(enabled, self.palette().buttonText().color())
+        return self._cached_state_icon(build_auto_next_icon, bool(enabled))
 
     def _build_follow_icon(self, enabled: bool) -> QIcon:
-        return build_follow_icon(enabled, self.palette().buttonText().color())
+        return self._cached_state_icon(build_follow_icon, bool(enabled))
 
     def _build_sun_icon(self) -> QIcon:
         return build_sun_icon()
@@ -1246,7 +1319,10 @@ class WaveformPlayer(QMainWindow):
         return build_moon_icon()
 
     def _system_prefers_dark(self) -> bool:
-        return system_prefers_dark(self)
+        # Theme re-applies reuse the last answer until the scheme signal, a palette event or the poll updates it.
+        if self._system_dark_cache is None:
+            self._system_dark_cache = system_prefers_dark(self)
+        return self._system_dark_cache
 
     def _resolve_playhead_color(self, effective_theme: str, accent: QColor) -> QColor:
         return resolve_playhead_color(self._playhead_color, effective_theme, accent)
@@ -1274,8 +1350,56 @@ class WaveformPlayer(QMainWindow):
             return
         self._theme_mode = mode
         self.theme_actions[mode].setChecked(True)
+        self._schedule_theme_apply()
+
+    def _schedule_theme_apply(self) -> None:
+        # Mode switches, settings applies and system-theme signals can land in the same event-loop pass;
+        # they collapse into one stylesheet apply.
+        if self._theme_apply_pending:
+            return
+        self._theme_apply_pending = True
+        QTimer.singleShot(0, self._run_scheduled_theme_apply)
+
+    def _run_scheduled_theme_apply(self) -> None:
+        if not self._theme_apply_pending:
+            return
+        self._theme_apply_pending = False
         self._apply_effective_theme()
 
+    def _theme_palette(self, effective: str, accent: QColor) -> dict[str, object]:
+        # darker()/lighter() go through HSV each time and mkPen/mkBrush re-parse their arguments;
+        # toggling between themes reuses the derived colours and the pens built from them.
+        key = (effective, accent.rgba())
+        palette = self._theme_palette_cache.get(key)
+        if palette is not None:
+            return palette
+        fill_color = QColor(accent)
+        if effective == "light":
+            fill_color.setAlpha(90)
+            palette = {
+                "wave_top": accent.darker(145),
+                "wave_bottom": accent.darker(120),
+                "fill": fill_color,
+                "load_label": accent.darker(180),
+                "axis_pen": pg.mkPen("#5a6d84"),
+            }
+        else:
+            fill_color.setAlpha(118)
+            palette = {
+                "wave_top": accent.lighter(125),
+                "wave_bottom": QColor(accent),
+                "fill": fill_color,
+                "load_label": accent.lighter(145),
+                "axis_pen": pg.mkPen("#9da8b5"),
+            }
+        palette["top_pen"] = pg.mkPen(width=1.1, color=palette["wave_top"])
+        palette["bottom_pen"] = pg.mkPen(width=1.1, color=palette["wave_bottom"])
+        palette["fill_brush"] = pg.mkBrush(fill_color)
+        if len(self._theme_palette_cache) >= 8:
+            self._theme_palette_cache.clear()
+        self._theme_palette_cache[key] = palette
+        return palette
+
     def _apply_effective_theme(self) -> None:
         if self._applying_theme:
             return
@@ -1285,13 +1409,8 @@ class WaveformPlayer(QMainWindow):
         else:
             effective = self._theme_mode
 
-        if (
-            effective == self._effective_theme
-            and self._accent_color == self._effective_accent_color
-            and self._playhead_color == self._effective_playhead_color
-            and abs(self._playhead_width - self._effective_playhead_width) < 0.01
-            and self.styleSheet()
-        ):
+        fingerprint = (effective, self._accent_color, self._playhead_color, round(float(self._playhead_width), 2))
+        if fingerprint == self._theme_fingerprint:
             return
 
         self._applying_theme = True
@@ -1303,56 +1422,42 @@ class WaveformPlayer(QMainWindow):
             playhead_color = self._resolve_playhead_color(effective, accent)
             playhead_width = max(1.0, min(float(self._playhead_width), 6.0))
 
+            # Re-setting an identical sheet still makes Qt re-parse it and re-polish every widget;
+            # playhead-only changes keep the applied one.
+            style_key = (effective, accent.rgba())
+            if style_key != self._applied_style_key or not self.styleSheet():
+                build_style = self._build_light_style if effective == "light" else self._build_dark_style
+                self.setStyleSheet(build_style(accent))
+                self._applied_style_key = style_key
+
+            palette = self._theme_palette(effective, accent)
+            self._wave_top_color = QColor(palette["wave_top"])
+            self._wave_bottom_color = QColor(palette["wave_bottom"])
+            self._wave_fill_color = QColor(palette["fill"])
             if effective == "light":
-                self.setStyleSheet(self._build_light_style(accent))
                 self.plot.setBackground("#ffffff")
-                axis_pen = pg.mkPen("#5a6d84")
-                wave_top_color = accent.darker(145)
-                wave_bottom_color = accent.darker(120)
-                fill_color = QColor(accent)
-                fill_color.setAlpha(90)
-                load_label_color = accent.darker(180)
-                self._wave_top_color = QColor(wave_top_color)
-                self._wave_bottom_color = QColor(wave_bottom_color)
-                self._wave_fill_color = QColor(fill_color)
-                self.wave_top.setPen(pg.mkPen(width=1.1, color=wave_top_color))
-                self.wave_bottom.setPen(pg.mkPen(width=1.1, color=wave_bottom_color))
-                self.wave_top.setBrush(pg.mkBrush(fill_color))
-                self.wave_bottom.setBrush(pg.mkBrush(fill_color))
-                self._apply_playhead_pen(playhead_color, playhead_width)
                 self.theme_button.setIcon(self.sun_icon)
-                self.wave_load_label.setStyleSheet(f"color: {load_label_color.name()};")
             else:
-                self.setStyleSheet(self._build_dark_style(accent))
                 self.plot.setBackground("#181818")
-                axis_pen = pg.mkPen("#9da8b5")
-                wave_top_color = accent.lighter(125)
-                wave_bottom_color = accent
-                fill_color = QColor(accent)
-                fill_color.setAlpha(118)
-                load_label_color = accent.lighter(145)
-                self._wave_top_color = QColor(wave_top_color)
-                self._wave_bottom_color = QColor(wave_bottom_color)
-                self._wave_fill_color = QColor(fill_color)
-                self.wave_top.setPen(pg.mkPen(width=1.1, color=wave_top_color))
-                self.wave_bottom.setPen(pg.mkPen(width=1.1, color=wave_bottom_color))
-                self.wave_top.setBrush(pg.mkBrush(fill_color))
-                self.wave_bottom.setBrush(pg.mkBrush(fill_color))
-                self._apply_playhead_pen(playhead_color, playhead_width)
                 self.theme_button.setIcon(self.moon_icon)
-                self.wave_load_label.setStyleSheet(f"color: {load_label_color.name()};")
+            axis_pen = palette["axis_pen"]
+            self.wave_top.setPen(palette["top_pen"])
+            self.wave_bottom.setPen(palette["bottom_pen"])
+            self.wave_top.setBrush(palette["fill_brush"])
+            self.wave_bottom.setBrush(palette["fill_brush"])
+            self._apply_playhead_pen(playhead_color, playhead_width)
+            self.wave_load_label.setStyleSheet(f"color: {palette['load_label'].name()};")
 
             axis_bottom = self.plot.getAxis("bottom")
             axis_bottom.setTextPen(axis_pen)
             axis_bottom.setPen(axis_pen)
+            self._last_draw = None
             self._apply_channel_wave_item_styles()
             self._update_repeat_button_text()
             self._set_auto_continue_enabled(self._auto_continue_enabled, save=False)
             self._set_follow_playhead_enabled(self._follow_playhead, save=False)
             self._effective_theme = effective
-            self._effective_accent_color = self._accent_color
-            self._effective_playhead_color = self._playhead_color
-            self._effective_playhead_width = self._playhead_width
+            self._theme_fingerprint = fingerprint
         finally:
             self._applying_theme = False
 
@@ -1382,24 +1487,29 @@ class WaveformPlayer(QMainWindow):
     def dropEvent(self, event: QDropEvent) -> None:  # noqa: N802
         return self.playlist_controller.dropEvent(event)
 
-    def _file_signature(self, path: str, points: int | None = None) -> str:
+    def _file_signature(self, path: str, points: int | None = None) -> tuple:
+        # Plain int tuples: probed on every cache lookup and preload pass, and cheaper to build and compare than text.
         stat = os.stat(path)
-        signature = f"{stat.st_size}:{stat.st_mtime_ns}"
-        if points is not None:
-            signature = f"{signature}|p{points}"
-        return signature
+        if points is None:
+            return (stat.st_size, stat.st_mtime_ns)
+        return (stat.st_size, stat.st_mtime_ns, points)
 
-    def _cache_get(self, path: str, signature: str):
+    def _cache_get(self, path: str, signature: tuple):
         cached = self.wave_cache.get(path)
         if cached and cached[0] == signature:
+            self.wave_cache.move_to_end(path)
             return cached
         return None
 
-    def _cache_store(self, path: str, signature: str, x: np.ndarray, amplitudes: np.ndarray) -> None:
-        self.wave_cache[path] = (signature, x, amplitudes)
-        if len(self.wave_cache) > 40:
-            oldest = next(iter(self.wave_cache))
-            self.wave_cache.pop(oldest, None)
+    def _cache_store(self, path: str, signature: tuple, x: np.ndarray, amplitudes: np.ndarray) -> None:
+        self.wave_cache[path] = (signature, x, self._pack_wave_amplitudes(amplitudes))
+        self.wave_cache.move_to_end(path)
+        # Least recently used first: tracks that keep being revisited stay cached.
+        while len(self.wave_cache) > 40:
+            self.wave_cache.popitem(last=False)
+
+    def _pin_current_channels(self, path: str, x: np.ndarray, amplitudes: np.ndarray) -> None:
+        return self.waveform_controller._pin_current_channels(path, x, amplitudes)
 
     def _fit_track_view(self) -> None:
         return self.waveform_controller._fit_track_view()
@@ -1407,7 +1517,7 @@ class WaveformPlayer(QMainWindow):
     def _current_track_path(self) -> str:
         return self.waveform_controller._current_track_path()
 
-    def _render_partial_for_path(self, path: str, signature: str) -> bool:
+    def _render_partial_for_path(self, path: str, signature: tuple) -> bool:
         return self.waveform_controller._render_partial_for_path(path, signature)
 
     def load_track(self, row: int) -> None:
@@ -1416,14 +1526,14 @@ class WaveformPlayer(QMainWindow):
     def _load_waveform_for_track(self, path: str) -> None:
         return self.waveform_controller._load_waveform_for_track(path)
 
-    def _start_active_wave_worker(self, path: str, signature: str, emit_progress: bool, points: int) -> None:
+    def _start_active_wave_worker(self, path: str, signature: tuple, emit_progress: bool, points: int) -> None:
         return self.waveform_controller._start_active_wave_worker(path, signature, emit_progress, points)
 
-    def _start_preload_wave_worker(self, path: str, signature: str, emit_progress: bool, points: int) -> None:
+    def _start_preload_wave_worker(self, path: str, signature: tuple, emit_progress: bool, points: int) -> None:
         return self.waveform_controller._start_preload_wave_worker(path, signature, emit_progress, points)
 
-    def _stop_active_wave_worker(self, wait_ms: int = 80) -> None:
-        return self.waveform_controller._stop_active_wave_worker(wait_ms=wait_ms)
+    def _stop_active_wave_worker(self) -> None:
+        return self.waveform_controller._stop_active_wave_worker()
 
     def _on_active_wave_progress(
         self,
@@ -1458,11 +1568,14 @@ class WaveformPlayer(QMainWindow):
     def _enqueue_preload(self, paths: list[str]) -> None:
         return self.waveform_controller._enqueue_preload(paths)
 
+    def _enqueue_preload_except(self, loaded_index: int | None) -> None:
+        return self.waveform_controller._enqueue_preload_except(loaded_index)
+
     def _start_next_preload(self) -> None:
         return self.waveform_controller._start_next_preload()
 
-    def _stop_preload_worker(self, requeue: bool, wait_ms: int = 80) -> None:
-        return self.waveform_controller._stop_preload_worker(requeue, wait_ms=wait_ms)
+    def _stop_preload_worker(self, requeue: bool, path: str | None = None) -> None:
+        return self.waveform_controller._stop_preload_worker(requeue, path)
 
     def _on_preload_progress(
         self,
@@ -1488,8 +1601,8 @@ class WaveformPlayer(QMainWindow):
     def _on_preload_failed(self, request_id: int, path: str, _error_message: str) -> None:
         return self.waveform_controller._on_preload_failed(request_id, path, _error_message)
 
-    def _on_preload_wave_thread_finished(self, request_id: int) -> None:
-        return self.waveform_controller._on_preload_wave_thread_finished(request_id)
+    def _on_preload_wave_thread_finished(self, request_id: int, path: str) -> None:
+        return self.waveform_controller._on_preload_wave_thread_finished(request_id, path)
 
     def _on_audio_outputs_changed(self) -> None:
         return self.playback_controller._on_audio_outputs_changed()
@@ -1,4 +1,4 @@
-from .feedback_service import post_feedback_issue
+from .feedback_service import FeedbackWorker, post_feedback_issue
 from .update_service import compare_versions, latest_release_info, version_tuple
 
-__all__ = ["post_feedback_issue", "compare_versions", "latest_release_info", "version_tuple"]
+__all__ = ["FeedbackWorker", "post_feedback_issue", "compare_versions", "latest_release_info", "version_tuple"]
@@ -5,9 +5,31 @@ import os
 import urllib.error
 import urllib.request
 
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except Exception:  # noqa: BLE001
+    orjson = None
+
 from audioplayer.constants import APP_VERSION, FEEDBACK_WORKER_DEFAULT_URL, FEEDBACK_WORKER_ENV_KEY, FEEDBACK_WORKER_ENV_URL
 
 
+def _dump_json(payload: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Compact UTF-8: titles and names with accents go out as-is instead of \u escapes.
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _load_json(raw: bytes | str):
+    if orjson is not None:
+        return orjson.loads(raw)
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return json.loads(raw)
+
+
 def post_feedback_issue(
     *,
     issue_kind: str,
@@ -61,15 +83,15 @@ def post_feedback_issue(
 
     req = urllib.request.Request(
         resolved_url,
-        data=json.dumps(payload).encode("utf-8"),
+        data=_dump_json(payload),
         method="POST",
         headers=headers,
     )
 
     try:
         with urllib.request.urlopen(req, timeout=20) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            data = json.loads(raw) if raw else {}
+            raw = resp.read()
+            data = _load_json(raw) if raw else {}
             url = str(data.get("issue_url", ""))
             success_message = str(data.get("message", "")).strip()
             if not success_message:
@@ -84,7 +106,7 @@ def post_feedback_issue(
         message = ""
         if raw:
             try:
-                parsed = json.loads(raw)
+                parsed = _load_json(raw)
                 message = str(parsed.get("message", "")).strip()
             except Exception:  # noqa: BLE001
                 message = raw.strip()
@@ -104,3 +126,23 @@ def post_feedback_issue(
             txt(f"Kon feedback niet posten: {exc}", f"Could not post feedback: {exc}"),
             "",
         )
+
+
+class _FeedbackSignals(QObject):
+    finished = Signal(bool, str, str)
+
+
+class FeedbackWorker(QRunnable):
+    """Runs post_feedback_issue on a pool thread; the result arrives through signals.finished."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__()
+        self.signals = _FeedbackSignals()
+        self._kwargs = kwargs
+
+    def run(self) -> None:
+        try:
+            ok, message, issue_url = post_feedback_issue(**self._kwargs)
+        except Exception as exc:  # noqa: BLE001
+            ok, message, issue_url = False, str(exc), ""
+        self.signals.finished.emit(ok, message, issue_url)
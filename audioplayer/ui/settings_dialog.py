@@ -18,7 +18,6 @@ if mido is not None and rtmidi is not None:
 
 from PySide6.QtCore import Qt, QUrl
 from PySide6.QtGui import QColor, QDesktopServices
-from PySide6.QtMultimedia import QMediaDevices
 from PySide6.QtWidgets import (
     QCheckBox,
     QColorDialog,
@@ -222,7 +221,7 @@ def open_settings_dialog(host) -> None:
 
     output_device_combo = QComboBox()
     output_devices = self._audio_output_devices()
-    default_device = QMediaDevices.defaultAudioOutput()
+    default_device = self._default_audio_output()
     default_name = default_device.description() or self._txt("Standaard output", "Default output")
     output_device_combo.addItem(
         self._txt(f"Systeem standaard ({default_name})", f"System default ({default_name})"),
@@ -255,7 +254,14 @@ def open_settings_dialog(host) -> None:
     audio_preview_label.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
     audio_form.addRow(self._txt("Audio status", "Audio status"), audio_preview_label)
 
+    audio_preview_state = {"stale": True}
+
     def refresh_audio_preview() -> None:
+        # Resolving the route is only worth it while the Audio tab is on screen; otherwise it waits for the tab.
+        if tabs.currentWidget() is not audio_tab:
+            audio_preview_state["stale"] = True
+            return
+        audio_preview_state["stale"] = False
         preferred_key = str(output_device_combo.currentData() or "")
         preferred, effective, switched, target = self._resolve_audio_device(
             preferred_key,
@@ -264,17 +270,23 @@ def open_settings_dialog(host) -> None:
             matrix=None,
             devices=output_devices,
         )
-        audio_preview_label.setText(
-            self._audio_route_note(
-                preferred,
-                effective,
-                switched,
-                target,
-                matrix_enabled=False,
-            )
+        text = self._audio_route_note(
+            preferred,
+            effective,
+            switched,
+            target,
+            matrix_enabled=False,
         )
+        # Re-selecting a device with the same route would otherwise re-run the word-wrap layout for nothing.
+        if audio_preview_label.text() != text:
+            audio_preview_label.setText(text)
+
+    def refresh_audio_preview_on_show(index: int) -> None:
+        if audio_preview_state["stale"] and index == tabs.indexOf(audio_tab):
+            refresh_audio_preview()
 
     output_device_combo.currentIndexChanged.connect(refresh_audio_preview)
+    tabs.currentChanged.connect(refresh_audio_preview_on_show)
     refresh_audio_preview()
 
     midi_enabled_checkbox = QCheckBox(self._txt("MIDI input activeren", "Enable MIDI input"))
@@ -513,7 +525,23 @@ def open_settings_dialog(host) -> None:
     self._midi_capture_callback = midi_capture_handler
     dialog.finished.connect(on_midi_dialog_finished)
 
-    refresh_midi_devices()
+    midi_devices_state = {"loaded": mido is None}
+
+    def load_midi_devices_on_first_show(index: int) -> None:
+        # Port enumeration probes the MIDI backend, so it waits until the MIDI tab is actually opened.
+        if midi_devices_state["loaded"] or index != tabs.indexOf(midi_tab):
+            return
+        midi_devices_state["loaded"] = True
+        refresh_midi_devices()
+        refresh_midi_status()
+        apply_midi_preview_from_controls()
+
+    if midi_devices_state["loaded"]:
+        refresh_midi_devices()
+    elif self._midi_input_name:
+        # Stand-in for the saved input, so Apply keeps it when the MIDI tab was never opened.
+        midi_device_combo.addItem(self._midi_input_name, self._midi_input_name)
+    tabs.currentChanged.connect(load_midi_devices_on_first_show)
     refresh_midi_mapping_rows()
     refresh_midi_status()
     midi_capture_label.setText(
@@ -683,7 +711,34 @@ def open_settings_dialog(host) -> None:
     apply_button = button_box.addButton(self._txt("Toepassen", "Apply"), QDialogButtonBox.ButtonRole.ApplyRole)
     layout.addWidget(button_box)
 
+    def saved_settings_state() -> tuple:
+        # MIDI fields come from the applied state: the live preview already writes the controls into self.
+        return (
+            self._language,
+            self._accent_color,
+            self._playhead_color,
+            self._playhead_width,
+            self._default_theme_mode,
+            self._default_repeat_mode,
+            self._default_auto_continue_enabled,
+            self._default_autoplay_on_add,
+            self._default_follow_playhead,
+            self._waveform_points,
+            self._waveform_view_mode,
+            self._audio_output_device_key,
+            midi_applied_state["enabled"],
+            midi_applied_state["input_name"],
+            midi_applied_state["channel"],
+            self._midi_note_map,
+        )
+
     def apply_settings(close_dialog: bool) -> None:
+        # Re-applying language, audio routing and theme is only needed for the fields that actually changed,
+        # so repeated Apply clicks without edits stay cheap.
+        saved_before = saved_settings_state()
+        language_before = self._language
+        audio_before = self._audio_output_device_key
+        theme_before = (self._accent_color, self._playhead_color, self._playhead_width)
         self._language = str(language_combo.currentData())
         self._accent_color = accent_color.name()
         self._playhead_color = playhead_color if playhead_color and QColor(playhead_color).isValid() else ""
@@ -702,15 +757,21 @@ def open_settings_dialog(host) -> None:
         self._midi_note_map = self._normalize_midi_note_map(midi_note_map_working)
         self._set_waveform_resolution(int(resolution_combo.currentData()), save=False)
         self._set_waveform_view_mode(str(waveform_view_combo.currentData()), save=False)
-        self._apply_audio_preferences(update_status=False)
+        if self._language == language_before and self._audio_output_device_key != audio_before:
+            # A language change re-applies the audio preferences itself, with the translated route note.
+            self._apply_audio_preferences(update_status=False)
         self._refresh_midi_input(update_status=False)
         midi_applied_state["enabled"] = self._midi_enabled
         midi_applied_state["input_name"] = self._midi_input_name
         midi_applied_state["channel"] = self._midi_channel
-        self._save_preferences()
-        self._apply_language()
-        self._apply_effective_theme()
+        if saved_settings_state() != saved_before:
+            self._save_preferences()
+        if self._language != language_before:
+            self._apply_language()
+        if (self._accent_color, self._playhead_color, self._playhead_width) != theme_before:
+            self._schedule_theme_apply()
         if close_dialog:
+            self._flush_preferences()
             dialog.accept()
 
     def on_accept() -> None:
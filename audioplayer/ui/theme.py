@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import functools
+
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QIcon, QPainter, QPainterPath, QPen, QPixmap
+from PySide6.QtGui import QColor, QGuiApplication, QIcon, QPainter, QPainterPath, QPen, QPixmap
 
 
 def qss_rgba(color: QColor, alpha: int) -> str:
@@ -10,7 +12,7 @@ def qss_rgba(color: QColor, alpha: int) -> str:
 
 def system_prefers_dark(widget) -> bool:
     try:
-        hints = widget.styleHints()
+        hints = QGuiApplication.styleHints()
         scheme = hints.colorScheme()
         if scheme == Qt.ColorScheme.Dark:
             return True
@@ -40,6 +42,13 @@ def make_playhead_pen(color: QColor, width: float) -> QPen:
 
 
 def build_dark_style(accent: QColor) -> str:
+    return _dark_style_for_rgba(accent.rgba())
+
+
+@functools.lru_cache(maxsize=8)
+def _dark_style_for_rgba(accent_rgba: int) -> str:
+    # Theme toggles and accent previews repeat the same few accents; the sheet only depends on the colour.
+    accent = QColor.fromRgba(accent_rgba)
     checked_bg = accent.darker(210)
     checked_border = accent.darker(165)
     list_selected = accent.darker(200)
@@ -201,6 +210,12 @@ QPushButton#IconControl:checked {{
 
 
 def build_light_style(accent: QColor) -> str:
+    return _light_style_for_rgba(accent.rgba())
+
+
+@functools.lru_cache(maxsize=8)
+def _light_style_for_rgba(accent_rgba: int) -> str:
+    accent = QColor.fromRgba(accent_rgba)
     checked_bg = accent.lighter(170)
     checked_border = accent.lighter(130)
     list_selected = accent.lighter(175)
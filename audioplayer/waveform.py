@@ -1,12 +1,129 @@
 from __future__ import annotations
 
-import math
+import functools
+import hashlib
+import os
+import queue
+import tempfile
 import time
+from pathlib import Path
 
 import numpy as np
 import pyqtgraph as pg
-import soundfile as sf
-from PySide6.QtCore import QThread, Signal
+from PySide6.QtCore import QObject, QThread, Signal
+
+try:
+    from numba import njit  # type: ignore[import-not-found]
+except Exception:  # noqa: BLE001
+    njit = None
+
+try:
+    import xxhash  # type: ignore[import-not-found]
+except Exception:  # noqa: BLE001
+    xxhash = None
+
+_INT16_PCM_SUBTYPES = {"PCM_S8", "PCM_U8", "PCM_16"}
+_CHUNK_TARGET_BYTES = 1 << 20
+WAVE_AMP_SCALE = 32767
+
+
+if njit is not None:
+
+    # Serial on purpose: pool workers and the warm-up thread call this concurrently, and numba's
+    # fallback workqueue threading layer aborts on concurrent parallel launches.
+    @njit(cache=True)
+    def _reduce_chunk_max(chunk, bucket, bin_offset, scale, amp):
+        frames = chunk.shape[0]
+        channels = min(chunk.shape[1], amp.shape[1])
+        last_bin = amp.shape[0] - 1
+        for ch in range(channels):
+            for i in range(frames):
+                b = min(bin_offset + i // bucket, last_bin)
+                v = abs(np.float32(chunk[i, ch])) * scale
+                if v > amp[b, ch]:
+                    amp[b, ch] = v
+
+    @njit(cache=True, fastmath=True)
+    def _wave_edges_kernel(x, out):
+        n = x.shape[0]
+        half = np.float32(0.5)
+        for i in range(n - 1):
+            out[i + 1] = (x[i] + x[i + 1]) * half
+        out[0] = max(np.float32(0.0), x[0] - (x[1] - x[0]) * half)
+        out[n] = x[n - 1] + (x[n - 1] - x[n - 2]) * half
+
+    @njit(cache=True, fastmath=True)
+    def _wave_bands_kernel(amp, centers, band_half, tops, bottoms):
+        for ch in range(amp.shape[1]):
+            center = centers[ch]
+            for i in range(amp.shape[0]):
+                offset = amp[i, ch] * band_half
+                tops[ch, i] = center + offset
+                bottoms[ch, i] = center - offset
+
+else:
+    _reduce_chunk_max = None
+    _wave_edges_kernel = None
+    _wave_bands_kernel = None
+
+
+def warm_wave_kernels() -> None:
+    # Compile (or load from the on-disk cache) every kernel specialisation the decoder and redraws use,
+    # so the first opened file does not pay for it. Meant to run off the GUI thread at startup.
+    if njit is None:
+        return
+    amp = np.zeros((4, 2), dtype=np.float32)
+    for chunk in (np.zeros((8, 2), dtype=np.int16), np.zeros((8, 2), dtype=np.float32)):
+        _reduce_chunk_max(chunk, 2, 0, np.float32(1.0), amp)
+    frozen_x = np.arange(4, dtype=np.float32)
+    frozen_x.flags.writeable = False
+    for x in (frozen_x, frozen_x.copy()):
+        _wave_edges_kernel(x, np.empty(5, dtype=np.float32))
+    tops = np.empty((2, 4), dtype=np.float32)
+    _wave_bands_kernel(amp, np.zeros(2, dtype=np.float32), np.float32(0.5), tops, np.empty_like(tops))
+
+
+@functools.lru_cache(maxsize=64)
+def _time_axis(bins: int, step_s: float) -> np.ndarray:
+    # Shared between jobs and progress emits, so it is frozen rather than copied.
+    x = np.arange(bins, dtype=np.float32)
+    x *= np.float32(step_s)
+    x.flags.writeable = False
+    return x
+
+
+def quantize_wave_amplitudes(amp: np.ndarray) -> np.ndarray:
+    # Peaks live in [0, 1] and are drawn at pixel resolution, so 16 bits per value is plenty for storage.
+    scaled = np.clip(amp, 0.0, 1.0) * np.float32(WAVE_AMP_SCALE)
+    scaled = np.nan_to_num(scaled, nan=0.0, copy=False)
+    return np.rint(scaled, out=scaled).astype(np.int16)
+
+
+def wave_step_edges(x: np.ndarray) -> np.ndarray:
+    # Bin edges for stepMode="center": midpoints inside, half a step beyond each end. Needs 2+ points.
+    edges = np.empty(x.size + 1, dtype=np.float32)
+    if _wave_edges_kernel is not None:
+        _wave_edges_kernel(x, edges)
+        return edges
+    mids = edges[1:-1]
+    np.add(x[:-1], x[1:], out=mids)
+    mids *= np.float32(0.5)
+    edges[0] = max(0.0, float(x[0]) - (float(x[1]) - float(x[0])) / 2.0)
+    edges[-1] = float(x[-1]) + (float(x[-1]) - float(x[-2])) / 2.0
+    return edges
+
+
+def wave_channel_bands(amp: np.ndarray, centers: np.ndarray, band_half: np.float32) -> tuple[np.ndarray, np.ndarray]:
+    # Returns C-ordered (channels, n) top and bottom outlines, one contiguous row per plot item.
+    if _wave_bands_kernel is not None:
+        tops = np.empty((amp.shape[1], amp.shape[0]), dtype=np.float32)
+        bottoms = np.empty_like(tops)
+        _wave_bands_kernel(amp, centers, band_half, tops, bottoms)
+        return tops, bottoms
+    tops = np.multiply(amp.T, band_half, order="C")
+    bottoms = np.subtract(centers[:, None], tops)
+    tops += centers[:, None]
+    return tops, bottoms
 
 
 def format_axis_time(seconds: float) -> str:
@@ -24,10 +141,11 @@ class TimeAxisItem(pg.AxisItem):
         return [format_axis_time(float(v)) for v in values]
 
 
-class WaveformJob(QThread):
+class WaveformJob(QObject):
     progressReady = Signal(int, str, object, object, int, int)
     resultReady = Signal(int, str, object, object)
     errorRaised = Signal(int, str, str)
+    finished = Signal()
 
     def __init__(
         self,
@@ -36,6 +154,7 @@ class WaveformJob(QThread):
         points: int,
         emit_progress: bool,
         progress_interval: float = 0.12,
+        cache_dir: Path | None = None,
     ) -> None:
         super().__init__()
         self.request_id = request_id
@@ -43,59 +162,267 @@ class WaveformJob(QThread):
         self.points = points
         self.emit_progress = emit_progress
         self.progress_interval = progress_interval
+        self.cache_dir = cache_dir
         self._cancelled = False
 
     def cancel(self) -> None:
         self._cancelled = True
 
+    @staticmethod
+    def _reduce_chunk_numpy(
+        chunk: np.ndarray,
+        bucket: int,
+        bin_start: int,
+        scale: np.float32,
+        amp: np.ndarray,
+        abs_buf: np.ndarray | None,
+    ) -> None:
+        bins = amp.shape[0]
+        channel_count = min(amp.shape[1], chunk.shape[1])
+        rows = chunk.shape[0] // bucket
+        blocks = chunk.reshape(rows, bucket, -1)
+        if abs_buf is None:
+            # Widen only the per-bucket extremes, so abs(-32768) cannot overflow.
+            seg_max = np.maximum(blocks.max(axis=1), -blocks.min(axis=1).astype(np.int32))
+            seg_max = seg_max.astype(np.float32) * scale
+        else:
+            abs_blocks = abs_buf[: chunk.shape[0]].reshape(rows, bucket, -1)
+            seg_max = np.abs(blocks, out=abs_blocks).max(axis=1)
+
+        if bin_start + rows > bins:
+            # Decoders can return a few frames more than the header promised; fold them into the last bin
+            # in place rather than building a clamped copy of the segment maxima.
+            keep = max(0, bins - 1 - bin_start)
+            last_row = amp[bins - 1, :channel_count]
+            np.maximum(last_row, seg_max[keep:, :channel_count].max(axis=0), out=last_row)
+            seg_max = seg_max[:keep]
+        target = amp[bin_start : bin_start + seg_max.shape[0], :channel_count]
+        np.maximum(target, seg_max[:, :channel_count], out=target)
+
+    @classmethod
+    def _reduce_chunk(
+        cls,
+        chunk: np.ndarray,
+        bucket: int,
+        bin_start: int,
+        scale: np.float32,
+        amp: np.ndarray,
+        abs_buf: np.ndarray | None,
+    ) -> None:
+        if _reduce_chunk_max is not None:
+            _reduce_chunk_max(chunk, bucket, bin_start, scale, amp)
+        else:
+            cls._reduce_chunk_numpy(chunk, bucket, bin_start, scale, amp, abs_buf)
+
+    def _emit_progress(
+        self,
+        x: np.ndarray,
+        amp: np.ndarray,
+        filled: int,
+        bins: int,
+        last_emit: float,
+        last_filled: int,
+    ) -> tuple[float, int]:
+        if not self.emit_progress:
+            return last_emit, last_filled
+        # Skip ticks that would repaint (nearly) the same envelope; a redraw costs far more than a check.
+        if filled - last_filled < max(1, bins // 128):
+            return last_emit, last_filled
+        now = time.monotonic()
+        if now - last_emit < self.progress_interval:
+            return last_emit, last_filled
+        # Bins fill front to back, so rows below `filled` are settled and a view is safe to hand over;
+        # at most the last row can still grow, which the next emit picks up.
+        self.progressReady.emit(self.request_id, self.path, x[:filled], amp[:filled], filled, bins)
+        return now, filled
+
+    def _disk_cache_path(self) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        raw_key = f"{self.path}|{stat.st_mtime_ns}|{stat.st_size}|{self.points}"
+        if xxhash is not None:
+            key = xxhash.xxh3_64_hexdigest(raw_key.encode("utf-8"))
+        else:
+            key = hashlib.blake2b(raw_key.encode("utf-8"), digest_size=8).hexdigest()
+        return self.cache_dir / f"{key}.npz"
+
+    @staticmethod
+    def _load_disk_cache(cache_path: Path | None) -> tuple[np.ndarray, np.ndarray] | None:
+        if cache_path is None or not cache_path.is_file():
+            return None
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                x = np.asarray(data["x"], dtype=np.float32)
+                amp = data["amp"]
+                if amp.dtype == np.int16:
+                    amp = np.multiply(amp, np.float32(1.0 / WAVE_AMP_SCALE), dtype=np.float32)
+                else:
+                    amp = np.asarray(amp, dtype=np.float32)
+        except Exception:  # noqa: BLE001
+            return None
+        if amp.ndim != 2 or x.shape[0] != amp.shape[0]:
+            return None
+        try:
+            # Touch the entry so eviction drops the least recently used waveforms first.
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return x, amp
+
+    @staticmethod
+    def _store_disk_cache(cache_path: Path | None, x: np.ndarray, amp: np.ndarray) -> None:
+        if cache_path is None:
+            return
+        tmp_path: Path | None = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp name per store: a cancelled job and its replacement can write the same key at once.
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=f"{cache_path.stem}.",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                tmp_path = Path(handle.name)
+                # Same int16 quantisation as the in-memory cache: half the bytes of float32 per entry.
+                np.savez(handle, x=x, amp=quantize_wave_amplitudes(amp))
+            os.replace(tmp_path, cache_path)
+        except Exception:  # noqa: BLE001
+            if tmp_path is not None:
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+
     def run(self) -> None:
+        if self._cancelled:
+            return
         try:
-            info = sf.info(self.path)
-            total_frames = int(info.frames)
-            sample_rate = int(info.samplerate)
-            channels = max(1, int(info.channels))
-
-            if total_frames <= 0 or sample_rate <= 0:
-                x = np.array([0.0], dtype=np.float32)
-                amp = np.zeros((1, channels), dtype=np.float32)
-                self.resultReady.emit(self.request_id, self.path, x, amp)
+            cache_path = self._disk_cache_path()
+            cached = self._load_disk_cache(cache_path)
+            if cached is not None:
+                self.resultReady.emit(self.request_id, self.path, cached[0], cached[1])
                 return
 
-            bucket = max(1, math.ceil(total_frames / self.points))
-            bins = max(1, math.ceil(total_frames / bucket))
-            x = np.linspace(0, total_frames / float(sample_rate), bins, dtype=np.float32)
-            amp = np.zeros((bins, channels), dtype=np.float32)
-
-            chunk_frames = min(max(bucket * 24, 8192), 262144)
-            frame_pos = 0
-            last_emit = 0.0
+            # libsndfile loads through CFFI; importing here keeps it off the startup path.
+            import soundfile as sf
 
+            # One open serves both the header and the decode.
             with sf.SoundFile(self.path) as audio_file:
+                total_frames = int(audio_file.frames)
+                sample_rate = int(audio_file.samplerate)
+                channels = max(1, int(audio_file.channels))
+                # Up to 16-bit PCM decodes losslessly to int16, at half the bytes of float32.
+                integer_pcm = str(audio_file.subtype) in _INT16_PCM_SUBTYPES
+                read_dtype = "int16" if integer_pcm else "float32"
+                sample_scale = np.float32(1.0 / 32768.0) if integer_pcm else np.float32(1.0)
+
+                if total_frames <= 0 or sample_rate <= 0:
+                    x = np.array([0.0], dtype=np.float32)
+                    amp = np.zeros((1, channels), dtype=np.float32)
+                    self.resultReady.emit(self.request_id, self.path, x, amp)
+                    return
+
+                bucket = max(1, -(-total_frames // self.points))
+                bins = max(1, -(-total_frames // bucket))
+                # Each point sits at the start of its bucket.
+                x = _time_axis(bins, bucket / float(sample_rate))
+                # Always per channel: the combined view folds to the loudest channel at draw time,
+                # so one cached envelope serves both views.
+                amp = np.zeros((bins, channels), dtype=np.float32)
+
+                # Size reads to ~1 MB of decoded samples: large enough for libsndfile and OS readahead
+                # to stream sequentially, small enough to stay cache friendly. Chunks are rounded up
+                # to whole buckets so every chunk reduces with a plain reshape.
+                bytes_per_frame = channels * np.dtype(read_dtype).itemsize
+                chunk_frames = max(bucket, _CHUNK_TARGET_BYTES // bytes_per_frame)
+                chunk_frames = -(-chunk_frames // bucket) * bucket
+                last_emit = 0.0
+                last_filled = 0
+                # Reuse one read buffer (and one abs buffer for float input) for the whole file.
+                chunk_buf = np.empty((chunk_frames, channels), dtype=read_dtype)
+                abs_buf = None if integer_pcm else np.empty((chunk_frames, channels), dtype=np.float32)
+                # Bind the per-chunk calls once. `_cancelled` and `emit_progress` stay attribute reads
+                # because the GUI thread can flip them while the job runs.
+                read_chunk = audio_file.read
+                reduce_chunk = self._reduce_chunk
+                emit_progress = self._emit_progress
+
+                frame_pos = 0
                 while not self._cancelled:
-                    chunk = audio_file.read(chunk_frames, dtype="float32", always_2d=True)
-                    if chunk.size == 0:
+                    chunk = read_chunk(dtype=read_dtype, always_2d=True, out=chunk_buf)
+                    frame_count = chunk.shape[0]
+                    if frame_count == 0:
                         break
 
-                    abs_chunk = np.abs(chunk)
-                    frame_count = abs_chunk.shape[0]
-                    idx = (frame_pos + np.arange(frame_count, dtype=np.int64)) // bucket
-                    idx[idx >= bins] = bins - 1
-                    channel_count = min(amp.shape[1], abs_chunk.shape[1])
-                    for channel_index in range(channel_count):
-                        np.maximum.at(amp[:, channel_index], idx, abs_chunk[:, channel_index])
-                    frame_pos += frame_count
+                    padded_count = -(-frame_count // bucket) * bucket
+                    if padded_count != frame_count:
+                        # Only the last chunk ends mid-bucket; zero padding leaves its peak unchanged.
+                        chunk_buf[frame_count:padded_count] = 0
+                        chunk = chunk_buf[:padded_count]
 
-                    if self.emit_progress:
-                        now = time.monotonic()
-                        if now - last_emit >= self.progress_interval:
-                            filled = min(bins, math.ceil(frame_pos / bucket))
-                            self.progressReady.emit(self.request_id, self.path, x, amp.copy(), filled, bins)
-                            last_emit = now
+                    reduce_chunk(chunk, bucket, frame_pos // bucket, sample_scale, amp, abs_buf)
+                    frame_pos += frame_count
+                    filled = min(bins, -(-frame_pos // bucket))
+                    last_emit, last_filled = emit_progress(x, amp, filled, bins, last_emit, last_filled)
 
             if self._cancelled:
                 return
 
+            self._store_disk_cache(cache_path, x, amp)
             self.resultReady.emit(self.request_id, self.path, x, amp)
         except Exception as exc:  # noqa: BLE001
             if not self._cancelled:
                 self.errorRaised.emit(self.request_id, self.path, str(exc))
+
+
+# Workers still stuck in a slow read at shutdown; referenced here so Qt never destroys a running QThread.
+_LINGERING_WORKERS: list[QThread] = []
+
+
+class _WaveformWorker(QThread):
+    def __init__(self, jobs: queue.Queue) -> None:
+        super().__init__()
+        self._jobs = jobs
+
+    def run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            try:
+                job.run()
+            finally:
+                job.finished.emit()
+
+
+class WaveformWorkerPool:
+    def __init__(self, worker_count: int = 2) -> None:
+        self._jobs: queue.Queue = queue.Queue()
+        # Jobs stay referenced until their finished signal has been delivered on the GUI thread.
+        self._pending: set[WaveformJob] = set()
+        self._workers = [_WaveformWorker(self._jobs) for _ in range(max(1, worker_count))]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, job: WaveformJob) -> None:
+        self._pending.add(job)
+        job.finished.connect(lambda j=job: self._pending.discard(j))
+        self._jobs.put(job)
+
+    def shutdown(self, wait_ms: int, fallback_wait_ms: int = 3000) -> bool:
+        for job in list(self._pending):
+            job.cancel()
+        for _worker in self._workers:
+            self._jobs.put(None)
+        finished = True
+        for worker in self._workers:
+            # A job blocked in a read on a slow share only sees the cancel once that read returns.
+            if not worker.wait(wait_ms) and not worker.wait(fallback_wait_ms):
+                finished = False
+                _LINGERING_WORKERS.append(worker)
+        return finished
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+pytest.importorskip("PySide6.QtMultimedia", exc_type=ImportError)
+
+from PySide6.QtWidgets import QApplication, QListWidget  # noqa: E402
+
+from audioplayer.controllers.playlist_controller import _TRACK_ROLE, PlaylistController  # noqa: E402
+from audioplayer.models import Track  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def _make_controller(app, names: list[str], playing: int) -> tuple[PlaylistController, SimpleNamespace, list[int]]:
+    tracks = [Track(path=f"/music/{name}.wav", name=name) for name in names]
+    host = SimpleNamespace(playlist=QListWidget(), tracks=tracks, current_index=playing)
+    host._current_track_path = lambda: host.tracks[host.current_index].path
+    controller = PlaylistController(host)
+    controller._rebuild_playlist_items(tracks[playing].path)
+    row_changes: list[int] = []
+    host.playlist.currentRowChanged.connect(row_changes.append)
+    return controller, host, row_changes
+
+
+def _assert_rows_match_tracks(host) -> None:
+    assert host.playlist.count() == len(host.tracks)
+    for row, track in enumerate(host.tracks):
+        item = host.playlist.item(row)
+        assert item.data(_TRACK_ROLE) is track
+        assert item.text() == track.name
+
+
+def test_reorder_moves_playing_row_and_remaps_current_index(app):
+    controller, host, row_changes = _make_controller(app, ["a", "b", "c", "d", "e"], playing=1)
+    playing = host.tracks[1]
+    order = [0, 3, 1, 2, 4]
+
+    controller._reorder_playlist_items(order, playing.path)
+
+    assert host.current_index == order.index(1)
+    assert host.tracks[host.current_index] is playing
+    assert host.playlist.currentRow() == host.current_index
+    assert host.playlist.currentItem().data(_TRACK_ROLE) is playing
+    _assert_rows_match_tracks(host)
+    # The playing track only moved, so no row change may reach the load_track handler.
+    assert row_changes == []
+
+
+def test_sort_by_name_during_playback_follows_playing_track(app):
+    controller, host, row_changes = _make_controller(app, ["delta", "Alpha", "charlie", "bravo"], playing=0)
+    playing = host.tracks[0]
+    order = sorted(range(len(host.tracks)), key=lambda index: host.tracks[index].name.lower())
+
+    controller.sort_playlist_by_name()
+
+    assert [track.name for track in host.tracks] == ["Alpha", "bravo", "charlie", "delta"]
+    assert host.current_index == order.index(0)
+    assert host.tracks[host.current_index] is playing
+    assert host.playlist.currentRow() == host.current_index
+    _assert_rows_match_tracks(host)
+    assert row_changes == []
+
+
+def test_sort_by_time_during_playback_follows_playing_track(app, monkeypatch):
+    controller, host, row_changes = _make_controller(app, ["a", "b", "c", "d"], playing=2)
+    playing = host.tracks[2]
+    durations = {"/music/a.wav": 30.0, "/music/b.wav": 10.0, "/music/c.wav": 40.0, "/music/d.wav": 20.0}
+    monkeypatch.setattr(controller, "_track_durations", lambda paths: [durations[path] for path in paths])
+
+    controller.sort_playlist_by_time_desc()
+
+    assert [track.name for track in host.tracks] == ["c", "a", "d", "b"]
+    assert host.current_index == 0
+    assert host.tracks[host.current_index] is playing
+    assert host.playlist.currentRow() == 0
+    _assert_rows_match_tracks(host)
+    assert row_changes == []